@@ -1,4 +1,6 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
 import gettext
 from pathlib import Path
 import threading
@@ -11,38 +13,49 @@ translation = gettext.translation(
 )
 translation.install()
 
-_current_translation = gettext.translation(
-    "messages", Path.cwd() / LOCALE_DIR, languages=[LANGUAGE_DEFAULT]
+
+@cache
+def get_catalog(lang: str) -> gettext.NullTranslations:
+    """Catalogue de la langue, chargé une seule fois par process"""
+    return gettext.translation(
+        "messages", Path.cwd() / LOCALE_DIR, languages=[lang], fallback=True
+    )
+
+
+# langue et catalogue actifs dans le contexte courant (thread, tâche asyncio),
+# à défaut la langue globale de LANGUAGE_CONFIG
+_active_language: ContextVar[tuple[str, gettext.NullTranslations] | None] = ContextVar(
+    "active_language", default=None
 )
 
 
 def init_i18n(lang: str):
-    global _current_translation
-    _current_translation = gettext.translation(
-        "messages", Path.cwd() / LOCALE_DIR, languages=[lang], fallback=True
-    )
+    """Active la langue dans le contexte courant"""
+    _active_language.set((lang, get_catalog(lang)))
 
 
 def _g(msg: str) -> str:
-    return _current_translation.gettext(msg)
+    active = _active_language.get()
+    if active is None:
+        return get_catalog(LANGUAGE_CONFIG.LANGUAGE).gettext(msg)
+    return active[1].gettext(msg)
 
 
 class LanguageConfig:
     _instance = None
     _lock = threading.Lock()
-    _local = None
 
     def __new__(cls):
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
                 cls._instance._language = LANGUAGE_DEFAULT
-                cls._instance._local = threading.local()
         return cls._instance
 
     @property
     def LANGUAGE(self) -> str:
-        return getattr(self._local, "language", self._language)
+        active = _active_language.get()
+        return self._language if active is None else active[0]
 
     @LANGUAGE.setter
     def LANGUAGE(self, value):
@@ -51,23 +64,19 @@ class LanguageConfig:
     @contextmanager
     def switch_language(self, lang: str):
         """Temporarily switch language in a context"""
-        old_lang = getattr(self._local, "language", LANGUAGE_DEFAULT)
-        assert self._local is not None
-        self._local.language = lang
-        init_i18n(lang)
+        token = _active_language.set((lang, get_catalog(lang)))
         try:
             yield
         finally:
-            self._local.language = old_lang
-            init_i18n(old_lang)
+            _active_language.reset(token)
 
 
 LANGUAGE_CONFIG = LanguageConfig()
 
 
 def set_language(lang: str) -> None:
-    init_i18n(lang)
     LANGUAGE_CONFIG.LANGUAGE = lang
+    init_i18n(lang)
 
 
 def current_language() -> str:
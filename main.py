@@ -2,6 +2,8 @@
 import argparse
 from importlib.util import module_from_spec, spec_from_file_location
 import logging
+import os
+from pathlib import Path
 import sys
 
 import i18n  # noqa
@@ -21,11 +23,35 @@ if __name__ == "__main__":
         type=str,
         help="Langue du script",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Nombre de process (par défaut : nombre de cœurs)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Ligne de chaque mod écrite une seule fois par page (update_index)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Régénère tout, même ce qui est à jour (update_index)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mesure la durée et la mémoire de chaque étape, build plus lent (update_index)",
+    )
     args = parser.parse_args()
 
-    spec = spec_from_file_location(args.filename, args.filename)
+    # nom importable (ex : scripts.update_index), nécessaire aux process workers
+    module_name = ".".join(Path(os.path.relpath(args.filename)).with_suffix("").parts)
+    spec = spec_from_file_location(module_name, args.filename)
     assert spec is not None and spec.loader
     module = module_from_spec(spec)
+    sys.modules[module_name] = module
     spec.loader.exec_module(module)
 
     error_format = (
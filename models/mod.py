@@ -1,13 +1,34 @@
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import MISSING, field, fields
 from datetime import datetime
 import enum
+from functools import cache
+import hashlib
+import json
 import re
+from types import MappingProxyType, SimpleNamespace
 from typing import Annotated, Literal
 
-from pydantic import ConfigDict, PositiveInt, StringConstraints, field_validator
+from pydantic import (
+    ConfigDict,
+    PositiveInt,
+    StringConstraints,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+)
 from pydantic.dataclasses import dataclass
 
 from i18n import _g, current_language
-from models.url import HttpUrl
+from models.url import HttpUrl, InternedHttpUrl
+from models.utils import (
+    RenderCache,
+    get_enum_flags,
+    get_flag_set,
+    get_mask,
+    memoized_property,
+)
 from settings import (
     CategoryEnum,
     GameEnum,
@@ -19,6 +40,24 @@ from settings import (
 link_regex = re.compile(r"\[\[[^].]+\]\]")
 external_link_regex = re.compile(r"\[(?P<name>[^\]]+)\]\((?P<url>[^)]+)\)")
 quote_regex = re.compile(r"`[^`]+`")
+
+
+@cache
+def get_markup_regex(links: bool, pipes: bool, quotes: bool) -> re.Pattern:
+    patterns = list()
+    if links:
+        patterns.append(f"(?P<link>{link_regex.pattern})")
+        patterns.append(f"(?P<external>{external_link_regex.pattern})")
+    if quotes:
+        patterns.append(f"(?P<quote>{quote_regex.pattern})")
+    if pipes:
+        patterns.append(r"(?P<pipe>\|)")
+    if not patterns:
+        return re.compile("(?!)")
+    # le lookahead sur le premier caractère évite de tester chaque motif à chaque position
+    return re.compile(r"(?=[\[`|])(?:" + "|".join(patterns) + ")")
+
+
 DateFormat = Annotated[str, StringConstraints(pattern=r"^(\d{4}-\d{2}-\d{2})?$")]
 
 
@@ -46,12 +85,28 @@ class Icon:
     label: str
 
 
-@dataclass(kw_only=True, eq=False, frozen=True, config=ConfigDict(extra="forbid"))
+@cache
+def get_icon_table(language: str) -> dict[str, dict[object, Icon]]:
+    """
+    Icône partagée de chaque valeur d'attribut, libellé traduit dans la langue courante.
+    Calculée une seule fois par langue.
+    """
+    table = dict()
+    for attr, data_icons in attrs_icon_data.items():
+        table[attr] = dict()
+        for values, data_icon in data_icons.items():
+            icon = Icon(icon=data_icon["icon"], label=_g(data_icon["label"]))
+            for value in values:
+                table[attr].setdefault(value, icon)
+    return table
+
+
+@dataclass(kw_only=True, eq=False, frozen=True, slots=True, config=ConfigDict(extra="forbid"))
 class Mod:
     id: PositiveInt
     name: str
     categories: list[CategoryEnum]
-    urls: list[HttpUrl]
+    urls: list[InternedHttpUrl]
     notes: list[str]
     description: str
     team: list[str]
@@ -67,13 +122,96 @@ class Mod:
     embedded_in: PositiveInt | None = None
     description_meta: dict | None = None
     notes_meta: dict | None = None
-    urls_extra: list[HttpUrl] | None = None
+    urls_extra: list[InternedHttpUrl] | None = None
     notes_extra: list[str] | None = None
+    # calculés, cf. __post_init__ et memoized_property
+    games_mask: int = field(init=False, repr=False, default=0)
+    status_mask: int = field(init=False, repr=False, default=0)
+    categories_mask: int = field(init=False, repr=False, default=0)
+    _memo: dict | None = field(init=False, repr=False, default=None)
 
     last_update_date_format = "%Y-%m-%d"
 
+    @classmethod
+    def validate_many(cls, records: Iterable[Mapping]) -> list["Mod"]:
+        """
+        Valide tous les mods en un seul appel à pydantic-core,
+        la date du jour n'est calculée qu'une fois pour toute la liste.
+        Les erreurs sont localisées par l'id du mod (ex : id=12.last_update),
+        la position dans la liste validée ne correspondant pas forcément à celle du fichier.
+        """
+        records = [record if isinstance(record, dict) else dict(record) for record in records]
+        try:
+            return mod_list_adapter.validate_python(
+                records,
+                context={"current_date": datetime.now().strftime(cls.last_update_date_format)},
+            )
+        except ValidationError as e:
+            raise ValidationError.from_exception_data(
+                e.title,
+                [
+                    error
+                    | {"loc": (f"id={records[error['loc'][0]].get('id')}", *error["loc"][1:])}
+                    for error in e.errors()
+                ],
+            ) from None
+
+    @classmethod
+    def construct(cls, record: Mapping) -> "Mod":
+        """
+        Construit le mod sans aucune validation (types convertis, champs inconnus ignorés).
+        À réserver aux données déjà validées, cf. `ModManager.get_mod_list(trusted=True)`
+        """
+        mod = object.__new__(cls)
+        for name, default, converter, setter in trusted_fields:
+            value = record.get(name, default)
+            if value is MISSING:
+                raise KeyError(f"{name} missing for mod {record.get('id')}")
+            if converter is not None and value is not None:
+                value = converter(value)
+            setter(mod, value)  # frozen : on passe outre __setattr__
+
+        mod.__post_init__()
+        return mod
+
+    def __post_init__(self) -> None:
+        """
+        Calcule les masques de games, status et categories.
+        games et status deviennent des frozenset partagés entre les mods de même masque.
+        """
+        games_mask = get_mask(GameEnum, self.games)
+        status_mask = get_mask(ModStatus, self.status)
+        set_attr = object.__setattr__  # frozen : on passe outre __setattr__
+        set_attr(self, "games_mask", games_mask)
+        set_attr(self, "games", get_flag_set(GameEnum, games_mask))
+        set_attr(self, "status_mask", status_mask)
+        set_attr(self, "status", get_flag_set(ModStatus, status_mask))
+        set_attr(self, "categories_mask", get_mask(CategoryEnum, self.categories))
+        set_attr(self, "_memo", None)
+
+    def compact(self) -> "Mod":
+        """
+        Stockage compact : tuples au lieu des listes, conteneurs vides partagés.
+        Utile pour garder toutes les langues en mémoire, cf. `ModManager.get_mod_list(compact=True)`
+        """
+        set_attr = object.__setattr__
+        for name in compact_fields:
+            value = getattr(self, name)
+            if type(value) is list:
+                set_attr(self, name, tuple(value))
+        for name in ("description_meta", "notes_meta"):
+            if getattr(self, name) == {}:
+                set_attr(self, name, empty_mapping)
+        if self.compatibilities:
+            set_attr(
+                self, "compatibilities", {k: tuple(v) for k, v in self.compatibilities.items()}
+            )
+        else:
+            set_attr(self, "compatibilities", empty_mapping)
+        return self
+
     @field_validator("last_update")
-    def check_last_update(cls, v):
+    def check_last_update(cls, v, info: ValidationInfo):
         if not v:
             return v
 
@@ -82,13 +220,15 @@ class Mod:
         except Exception as e:
             raise e
 
-        current_date = datetime.now().strftime(cls.last_update_date_format)
+        current_date = (info.context or dict()).get("current_date") or datetime.now().strftime(
+            cls.last_update_date_format
+        )
         min_date = "1999-01-01"
         if min_date <= v <= current_date:
             return v
         raise ValueError(f"Date not possible, must be between {min_date} and {current_date}")
 
-    @property
+    @memoized_property(by_language=True)
     def translation_state_auto(self) -> TranslationStateEnum:
         if self.translation_state == TranslationStateEnum.AUTO:
             if not self.languages:
@@ -111,83 +251,143 @@ class Mod:
 
         return self.urls
 
-    @property
+    @memoized_property(by_language=True)
     def icons(self) -> list[Icon]:
-        icons = list()
-        for attr, data_icons in attrs_icon_data.items():
-            value = getattr(self, attr)
-            for k, v in data_icons.items():
-                if value in k:
-                    data_icon = v
-                    break
-            else:
-                raise ValueError(f"icon not found for {self.name}")
-            icons.append(Icon(**data_icon))
-
-        return icons
+        try:
+            return [
+                icons[getattr(self, attr)]
+                for attr, icons in get_icon_table(current_language()).items()
+            ]
+        except KeyError:
+            raise ValueError(f"icon not found for {self.name}") from None
 
     def convert_txt(self, txt: str, mod_id_to_name: dict[int, str] | None = None) -> str:
-        return self._convert_quote(
-            self._convert_pipe(self._convert_link(txt, mod_id_to_name=mod_id_to_name))
-        )
+        return self._compile_markup(txt, mod_id_to_name=mod_id_to_name)
 
     def _convert_quote(self, txt: str) -> str:
-        quoted_txt = txt
-        for quote in quote_regex.findall(quoted_txt):
-            quoted_txt = quoted_txt.replace(
-                quote, f'<span class="quote">{quote.strip("`")}</span>'
-            )
-
-        return quoted_txt
+        return self._compile_markup(txt, links=False, pipes=False)
 
     def _convert_link(self, txt: str, mod_id_to_name: dict[int, str] | None = None) -> str:
-        linked_txt = txt
-        for link in link_regex.findall(txt):
-            mod_id = link.strip("[] ")
+        return self._compile_markup(
+            txt, mod_id_to_name=mod_id_to_name, pipes=False, quotes=False
+        )
+
+    def _convert_pipe(self, txt: str) -> str:
+        return self._compile_markup(txt, links=False, quotes=False)
+
+    def _compile_markup(
+        self,
+        txt: str,
+        mod_id_to_name: dict[int, str] | None = None,
+        *,
+        links: bool = True,
+        pipes: bool = True,
+        quotes: bool = True,
+    ) -> str:
+        """
+        Convertit en html, en une seule passe, les aides de mise en forme :
+        [[id]] et [nom](url) (links), | (pipes) et `citation` (quotes)
+        """
+        if "[" not in txt and "`" not in txt and "|" not in txt:
+            return txt
+
+        def compile_match(match: re.Match) -> str:
+            kind = match.lastgroup
+            if kind == "pipe":
+                return "<br/>"
+            elif kind == "quote":
+                content = self._compile_markup(
+                    match.group(kind)[1:-1],
+                    mod_id_to_name,
+                    links=links,
+                    pipes=pipes,
+                    quotes=False,
+                )
+                return f'<span class="quote">{content}</span>'
+            elif kind == "external":
+                name, url = (
+                    self._compile_markup(
+                        match.group(group), links=False, pipes=pipes, quotes=quotes
+                    )
+                    for group in ("name", "url")
+                )
+                return f'<a href="{url}" target="_blank">{name}</a>'
+
+            link = match.group(kind)
             try:
-                mod_id = int(mod_id)
+                mod_id = int(link.strip("[] "))
             except ValueError:
                 # no change
-                pass
-            else:
-                url = self.get_internal_link(mod_id, mod_id_to_name)
-                linked_txt = linked_txt.replace(link, url)
-        for link in external_link_regex.findall(linked_txt):
-            name, url = link
-            linked_txt = linked_txt.replace(
-                f"[{name}]({url})", f'<a href="{url}" target="_blank">{name}</a>'
-            )
+                return link
+            internal_link = self.get_internal_link(mod_id, mod_id_to_name)
+            return internal_link.replace("|", "<br/>") if pipes else internal_link
 
-        return linked_txt
-
-    def _convert_pipe(self, txt: str) -> str:
-        return txt.replace("|", "<br/>")
+        return get_markup_regex(links, pipes, quotes).sub(compile_match, txt)
 
     def get_description(self, mod_id_to_name: dict[int, str] | None = None) -> str:
-        return self.convert_txt(self.description, mod_id_to_name=mod_id_to_name)
+        return render_cache.get(
+            self.get_render_key("description", mod_id_to_name),
+            lambda: self.convert_txt(self.description, mod_id_to_name=mod_id_to_name),
+        )
 
-    @property
+    @memoized_property()
+    def content_hash(self) -> str:
+        content = json.dumps(
+            [getattr(self, name) for name in content_fields],
+            default=_json_default,
+        )
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    @memoized_property()
+    def linked_mod_ids(self) -> list[int]:
+        """Mods dont le nom apparaît dans les textes rendus"""
+        mod_ids = {
+            mod_id
+            for mod_ids in self.compatibilities.values()
+            for mod_id in mod_ids
+            if type(mod_id) is int
+        }
+        if self.embedded_in:
+            mod_ids.add(self.embedded_in)
+        for txt in (self.description, *self.notes):
+            for link in link_regex.findall(txt):
+                try:
+                    mod_ids.add(int(link.strip("[] ")))
+                except ValueError:
+                    pass
+        return sorted(mod_ids)
+
+    def get_render_key(self, kind: str, mod_id_to_name: dict[int, str] | None = None) -> str:
+        """Clé du rendu : contenu du mod, langue courante et noms des mods liés"""
+        if mod_id_to_name is None:
+            names_hash = "-"
+        else:
+            names = [mod_id_to_name.get(mod_id) for mod_id in self.linked_mod_ids]
+            names_hash = hashlib.blake2b(json.dumps(names).encode(), digest_size=8).hexdigest()
+        return f"{kind}:{current_language()}:{self.content_hash}:{names_hash}"
+
+    @memoized_property()
     def safe_note(self) -> int:
         note = 2
         if self.is_outdated:
             note -= 1
-        if not self.is_weidu and CategoryEnum.PARTY_PERSONNALISATION not in self.categories:
+        if not self.is_weidu and not self.categories_mask & CategoryMask.PARTY_PERSONNALISATION:
             note -= 1
         if "temnix" in self.authors:  # déso
             note -= 1
-        if self.embedded_in or self.status & {ModStatus.EMBED, ModStatus.OBSOLETE}:
+        if self.embedded_in or self.status_mask & (StatusMask.EMBED | StatusMask.OBSOLETE):
             note = 0
-        elif ModStatus.ARCHIVED in self.status:
+        elif self.status_mask & StatusMask.ARCHIVED:
             note -= 1
-        elif self.status & {ModStatus.UNRELEASED, ModStatus.BETA, ModStatus.MISSING}:
+        elif self.status_mask & (StatusMask.UNRELEASED | StatusMask.BETA | StatusMask.MISSING):
             note = min(1, note)
         return max(0, note)
 
     @property
     def is_EE(self) -> bool:
-        return bool(self.games & GameEnum.EE())
+        return bool(self.games_mask & GameMask.EE)
 
-    @property
+    @memoized_property()
     def is_outdated(self) -> bool:
         # EE 2.0 sortie en avril 2016, on considère que tous les mods EE faits avant cette date sont incompatibles
         # EE 2.6 sortie en avril 2021 : sont outdated les mods d'interface et de modification d'exe (pas de catégorie associée)
@@ -198,7 +398,7 @@ class Mod:
                 self.last_update < "2016-04-01"
                 or (
                     self.last_update < "2021-04-01"
-                    and CategoryEnum.INTERFACE in self.categories
+                    and self.categories_mask & CategoryMask.INTERFACE
                 )
             )
         )
@@ -286,11 +486,87 @@ class Mod:
         return f'<a href="#m{mod_id}">{mod_name}</a>'
 
     def get_notes(self, mod_id_to_name: dict[int, str] | None = None) -> list[str]:
-        return [
-            self.convert_txt(note, mod_id_to_name=mod_id_to_name)
-            for note in self.notes + self.get_auto_notes(mod_id_to_name=mod_id_to_name)
-        ]
+        notes = render_cache.get(
+            self.get_render_key("notes", mod_id_to_name),
+            lambda: [
+                self.convert_txt(note, mod_id_to_name=mod_id_to_name)
+                for note in [*self.notes, *self.get_auto_notes(mod_id_to_name=mod_id_to_name)]
+            ],
+        )
+        return list(notes)
 
-    @property
+    @memoized_property()
     def games_ordered(self) -> list[GameEnum]:
         return [game for game in GameEnum if game in self.games]
+
+
+mod_list_adapter: TypeAdapter[list[Mod]] = TypeAdapter(list[Mod])
+
+# masques précalculés, à comparer avec Mod.games_mask, Mod.status_mask et Mod.categories_mask
+GameMask = SimpleNamespace(
+    **{game.name: flag for game, flag in get_enum_flags(GameEnum).items()},
+    pst=get_mask(GameEnum, GameEnum.pst()),
+    iwd=get_mask(GameEnum, GameEnum.iwd()),
+    bg1=get_mask(GameEnum, GameEnum.bg1()),
+    bg2=get_mask(GameEnum, GameEnum.bg2()),
+    BG_EE=get_mask(GameEnum, GameEnum.BG_EE()),
+    IWD_EE=get_mask(GameEnum, GameEnum.IWD_EE()),
+    EE=get_mask(GameEnum, GameEnum.EE()),
+)
+StatusMask = SimpleNamespace(
+    **{status.name: flag for status, flag in get_enum_flags(ModStatus).items()}
+)
+CategoryMask = SimpleNamespace(
+    **{category.name: flag for category, flag in get_enum_flags(CategoryEnum).items()}
+)
+
+# rendus HTML des descriptions et notes, partagés par toutes les pages
+render_cache = RenderCache()
+
+# conversions appliquées par `Mod.construct`, en lieu et place de la validation
+trusted_converters: dict[str, Callable] = {
+    "categories": lambda values: [CategoryEnum._value2member_map_[value] for value in values],
+    "urls": lambda values: [HttpUrl.from_trusted(value) for value in values],
+    "urls_extra": lambda values: [HttpUrl.from_trusted(value) for value in values],
+    "games": lambda values: {GameEnum._value2member_map_[value] for value in values},
+    "status": lambda values: {ModStatus._value2member_map_[value] for value in values},
+    "translation_state": TranslationStateEnum._value2member_map_.__getitem__,
+    "notes": list,
+    "notes_extra": list,
+    "team": list,
+    "languages": list,
+    "authors": list,
+    "compatibilities": lambda value: {k: list(v) for k, v in value.items()},
+}
+# champs de données, hors champs calculés
+content_fields: list[str] = [field.name for field in fields(Mod) if field.init]
+trusted_fields: list[tuple[str, object, Callable | None, Callable]] = [
+    (
+        name,
+        Mod.__dataclass_fields__[name].default,
+        trusted_converters.get(name),
+        getattr(Mod, name).__set__,
+    )
+    for name in content_fields
+]
+
+# champs convertis en tuple par `Mod.compact`
+compact_fields: list[str] = [
+    "categories",
+    "urls",
+    "notes",
+    "team",
+    "languages",
+    "authors",
+    "urls_extra",
+    "notes_extra",
+]
+empty_mapping: Mapping = MappingProxyType({})
+
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
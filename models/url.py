@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from functools import cache, cached_property
 from pathlib import Path
+from typing import Annotated
 
 from pydantic import HttpUrl as PydHttpUrl
+from pydantic import ValidatorFunctionWrapHandler, WrapValidator
 
-from settings import FLAG_DIR, SITE_DIR, DomainImageEnum, image_data
+from settings import FLAG_DIR, SITE_DIR, STATIC_PATH, DomainImageEnum, image_data
 
 
 @dataclass(slots=True, kw_only=True)
@@ -43,11 +46,22 @@ class HttpUrl(PydHttpUrl):
         "trow.cc": DomainImageEnum.TROW,
     }
 
+    @classmethod
+    def from_trusted(cls, url: str) -> "HttpUrl":
+        """
+        Url déjà validée : chaque url n'est validée qu'une fois par process, cf. `url_cache`
+        """
+        try:
+            return url_cache[url]
+        except KeyError:
+            instance = url_cache[url] = cls(url)
+            return instance
+
     @property
     def url(self) -> str:
         return str(self)
 
-    @property
+    @cached_property
     def is_direct_archive(self) -> bool:
         return bool(
             self.path
@@ -57,7 +71,7 @@ class HttpUrl(PydHttpUrl):
             and (not self.host.startswith("github.com") or "/raw/refs/" in self.path)
         )
 
-    @property
+    @cached_property
     def tld(self) -> str:
         return self.host.rpartition(".")[-1] if self.host else ""
 
@@ -65,7 +79,7 @@ class HttpUrl(PydHttpUrl):
     def is_external(self) -> bool:
         return True
 
-    @property
+    @cached_property
     def image(self) -> Image | None:
         img = self._image_domain() or self._image_country()
         if not img:
@@ -87,12 +101,8 @@ class HttpUrl(PydHttpUrl):
 
     def _image_country(self) -> str:
         country_img = f"{self.tld}{DomainImageEnum.COUNTRY_FLAG}"
-        img = ""
         # auto-select
-        if (FLAG_DIR / country_img).exists():
-            img = country_img
-
-        return img
+        return country_img if country_img in get_image_names(FLAG_DIR) else ""
 
     def _image_domain(self) -> str:
         domain = self.host.removeprefix("www.") if self.host else ""
@@ -104,3 +114,33 @@ class HttpUrl(PydHttpUrl):
             img = self.domain_to_image.get(domain, "")
 
         return img
+
+
+@cache
+def get_image_names(img_dir: Path) -> frozenset[str]:
+    """Images présentes dans le dossier (relatif à STATIC_PATH), listées une seule fois"""
+    path = STATIC_PATH / img_dir
+    return (
+        frozenset(file.name for file in path.iterdir() if file.is_file())
+        if path.is_dir()
+        else frozenset()
+    )
+
+
+# cache process-wide : url brute → instance validée, partagée par tous les mods et toutes les langues
+# N'y entrent que des instances validées (validateur ou `HttpUrl.from_trusted`) :
+# une url invalide ne peut pas y être lue par `intern_url`.
+url_cache: dict[str, HttpUrl] = dict()
+
+
+def intern_url(value, handler: ValidatorFunctionWrapHandler) -> HttpUrl:
+    if type(value) is not str:
+        return handler(value)
+    try:
+        return url_cache[value]
+    except KeyError:
+        url = url_cache[value] = handler(value)
+        return url
+
+
+InternedHttpUrl = Annotated[HttpUrl, WrapValidator(intern_url)]
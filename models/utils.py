@@ -1,6 +1,17 @@
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from functools import cache, wraps
+import json
+from json import JSONDecodeError
+import os
+from pathlib import Path
 import re
+from typing import IO, Any
 from unicodedata import normalize
 
+from i18n import current_language
+
 
 def slugify(value: str) -> str:
     """
@@ -11,3 +22,129 @@ def slugify(value: str) -> str:
     value = normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     value = re.sub(r"[^\w\s-]", "", value).strip().lower()
     return re.sub(r"[-\s]+", "-", value)
+
+
+@cache
+def get_enum_flags(enum_cls: type[Enum]) -> dict[Enum, int]:
+    """Bit associé à chaque membre de l'énumération, dans l'ordre de déclaration"""
+    return {member: 1 << index for index, member in enumerate(enum_cls)}
+
+
+def get_mask(enum_cls: type[Enum], members: Iterable[Enum]) -> int:
+    flags = get_enum_flags(enum_cls)
+    mask = 0
+    for member in members:
+        mask |= flags[member]
+    return mask
+
+
+@cache
+def get_flag_set(enum_cls: type[Enum], mask: int) -> frozenset:
+    """Ensemble des membres d'un masque, partagé par tous les mods ayant le même masque"""
+    return frozenset(member for member, flag in get_enum_flags(enum_cls).items() if mask & flag)
+
+
+def memoized_property(by_language: bool = False) -> Callable[[Callable], property]:
+    """
+    Property calculée une seule fois par instance (et par langue courante si by_language).
+    Le résultat est stocké dans l'attribut `_memo` de l'instance (None par défaut) :
+    fonctionne aussi avec les dataclass frozen et slots.
+    """
+
+    def decorator(func: Callable) -> property:
+        name = func.__name__
+
+        @wraps(func)
+        def wrapper(self) -> Any:
+            memo = self._memo
+            if memo is None:
+                memo = dict()
+                object.__setattr__(self, "_memo", memo)
+            key = (name, current_language()) if by_language else name
+            try:
+                return memo[key]
+            except KeyError:
+                value = memo[key] = func(self)
+                return value
+
+        return property(wrapper)
+
+    return decorator
+
+
+class RenderCache:
+    """
+    Fragments HTML rendus (descriptions, notes), indexés par une clé calculée par l'appelant.
+    La couche persistante est optionnelle : seuls les fragments utilisés lors du rendu sont sauvegardés.
+    """
+
+    def __init__(self) -> None:
+        self.fragments: dict[str, Any] = dict()
+        self.used: set[str] = set()
+        self.path: Path | None = None
+        self.version = ""
+
+    def get(self, key: str, render: Callable[[], Any]) -> Any:
+        self.used.add(key)
+        try:
+            return self.fragments[key]
+        except KeyError:
+            value = self.fragments[key] = render()
+            return value
+
+    def load(self, path: Path, version: str) -> None:
+        """
+        Charge les fragments persistés, ignorés si le code de rendu a changé (version).
+        Les fragments utilisés sont décomptés à partir de ce chargement, cf. save
+        """
+        self.path = path
+        self.version = version
+        self.used = set()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            return
+
+        if data.get("version") == version:
+            self.fragments.update(data.get("fragments", {}))
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        fragments = {key: self.fragments[key] for key in sorted(self.used)}
+        write_json_atomic(
+            self.path, {"version": self.version, "fragments": fragments}, ensure_ascii=False
+        )
+
+
+@contextmanager
+def atomic_write(
+    path: Path, mode: str = "w", should_replace: Callable[[], bool] | None = None
+) -> Iterator[IO]:
+    """
+    Écrit dans un fichier temporaire qui ne remplace path qu'une fois complet :
+    un process interrompu ne laisse jamais de fichier à moitié écrit,
+    le fichier temporaire est supprimé en cas d'erreur.
+    should_replace : appelé une fois le fichier écrit, False pour garder le fichier existant
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if should_replace is None or should_replace():
+        os.replace(tmp_path, path)
+    else:
+        tmp_path.unlink()
+
+
+def write_json_atomic(path: Path, data: Any, **kwargs) -> None:
+    """kwargs : options de json.dump"""
+    with atomic_write(path) as f:
+        json.dump(data, f, **kwargs)
@@ -0,0 +1,45 @@
+import gc
+import tracemalloc
+
+from scripts.utils import ModManager, get_languages
+
+"""
+Mémoire occupée par les fichiers json décodés de toutes les langues,
+puis par les mods chargés simultanément en stockage standard et compact
+(`ModManager.get_mod_list(compact=True)`).
+
+    uv run main.py scripts/benchmark/mod_memory.py
+"""
+
+
+def measure(languages: list[str], compact: bool) -> tuple[int, int]:
+    """Renvoie le nombre de mods chargés et les octets alloués pour les construire"""
+    gc.collect()
+    tracemalloc.start()
+    mods = {
+        language: ModManager.get_mod_list(language, trusted=True, compact=compact)
+        for language in languages
+    }
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sum(map(len, mods.values())), size
+
+
+def main(**kwargs) -> None:
+    languages = get_languages()
+    tracemalloc.start()
+    ModManager.preload(["", *languages])
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"    json: {len(languages) + 1} fichiers, {size / 1024:.0f} Kio")
+
+    # caches de module, hors mesure
+    ModManager.get_mod_list(languages[0], trusted=True)
+
+    for compact in (False, True):
+        mod_nb, size = measure(languages, compact)
+        print(
+            f"{'compact' if compact else 'standard':>8}: {len(languages)} langues, {mod_nb} mods, "
+            f"{size / 1024:.0f} Kio ({size / mod_nb:.0f} octets par mod)"
+        )
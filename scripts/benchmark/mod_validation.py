@@ -0,0 +1,46 @@
+from statistics import median
+from time import perf_counter
+
+from models.mod import Mod
+from scripts.utils import ModManager, get_languages
+
+"""
+Compare la validation mod par mod (`Mod(**mod)`) à la validation par lot (`Mod.validate_many`).
+
+    uv run main.py scripts/benchmark/mod_validation.py
+"""
+
+REPEAT = 5
+
+
+def timeit(func, *args) -> float:
+    timings = list()
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func(*args)
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+def validate_per_record(source_list) -> list[Mod]:
+    return [Mod(**mod) for mod in source_list]
+
+
+def main(**kwargs) -> None:
+    total_per_record = total_batch = 0.0
+    for language in ["", *get_languages()]:
+        source_list = ModManager.get_source_list(language)
+        per_record = timeit(validate_per_record, source_list)
+        batch = timeit(Mod.validate_many, source_list)
+        total_per_record += per_record
+        total_batch += batch
+        print(
+            f"{language or 'source':>6} ({len(source_list)} mods): "
+            f"per record {per_record * 1000:.1f} ms, batch {batch * 1000:.1f} ms "
+            f"(x{per_record / batch:.2f})"
+        )
+
+    print(
+        f" total: per record {total_per_record * 1000:.1f} ms, batch {total_batch * 1000:.1f} ms "
+        f"(x{total_per_record / total_batch:.2f})"
+    )
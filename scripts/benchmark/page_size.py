@@ -0,0 +1,33 @@
+from scripts.update_index import render_language_page
+from scripts.utils import get_languages
+from settings import language_flags, resize_image_from_width
+
+"""
+Compare le poids des pages de langue générées normalement et avec --dedupe.
+
+    uv run main.py scripts/benchmark/page_size.py
+"""
+
+
+def main(**kwargs) -> None:
+    resize_image_from_width(24)
+    languages = sorted(set(get_languages()) & language_flags.keys())
+    used_language_flags = {k: v for k, v in language_flags.items() if k in languages}
+
+    total_full = total_dedupe = 0
+    for language in languages:
+        full, _, _ = render_language_page(language, used_language_flags)
+        dedupe, _, _ = render_language_page(language, used_language_flags, dedupe=True)
+        full_size = len("".join(full).encode())
+        dedupe_size = len("".join(dedupe).encode())
+        total_full += full_size
+        total_dedupe += dedupe_size
+        print(
+            f"{language:>5}: {full_size / 1024:.0f} Kio → {dedupe_size / 1024:.0f} Kio "
+            f"(-{100 - dedupe_size * 100 / full_size:.0f} %)"
+        )
+
+    print(
+        f"total: {total_full / 1024:.0f} Kio → {total_dedupe / 1024:.0f} Kio "
+        f"(-{100 - total_dedupe * 100 / total_full:.0f} %)"
+    )
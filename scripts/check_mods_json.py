@@ -5,7 +5,7 @@ from typing import Pattern
 from iteration_utilities import duplicates
 from pydantic import HttpUrl
 
-from scripts.utils import ModManager, get_languages
+from scripts.utils import ModManager, get_languages, map_languages
 from settings import language_flags
 
 mod_link: Pattern = re.compile(r"\[\[([0-9]+)\]\]")
@@ -17,25 +17,31 @@ def main(**kwargs):
     duplicate_ids = list(duplicates(str(mod["id"]) for mod in mod_list))
     assert not duplicate_ids, f"🔴 ID duplicates : {' ; '.join(duplicate_ids)}"
 
-    for language in get_languages():
-        check_json(language)
+    languages = get_languages()
+    for warnings in map_languages(check_json, languages, jobs=kwargs.get("jobs")):
+        for warning in warnings:
+            print(warning)
 
     # check tp2 unicity
     duplicate_tp2s = set(duplicates(str(mod["tp2"]) for mod in mod_list))
     duplicate_tp2s -= {"", "n/a", "non-weidu"}
     if duplicate_tp2s:
         print(
-            f"🟡 Global TP2 duplicates ({len(duplicate_tp2s)}) → {' ; '.join(duplicate_tp2s)}"
+            f"🟡 Global TP2 duplicates ({len(duplicate_tp2s)}) → {' ; '.join(sorted(duplicate_tp2s))}"
         )
 
+    # les mods validés pourront être chargés sans validation, cf. ModManager.get_mod_list
+    ModManager.write_validation_stamp(languages)
+
     print("✅ Tests")
 
 
-def check_json(language) -> None:
+def check_json(language) -> list[str]:
     mods = ModManager.get_mod_list(language=language)
 
     mod_ids = set(str(mod.id) for mod in mods)
     nb_warnings = 0
+    warnings: list[str] = list()
     mod_urls: list[HttpUrl] = list()
 
     for mod in mods:
@@ -51,14 +57,16 @@ def check_json(language) -> None:
 
         # check languages
         for lang in set(mod.languages) - language_flags.keys():
-            print(f"🟡 {language} Unknown lang →", lang)
+            warnings.append(f"🟡 {language} Unknown lang → {lang}")
             nb_warnings += 1
 
     # check urls
     duplicate_urls_counter = Counter(duplicates(mod_urls))
     for url, nb_occurence in sorted(duplicate_urls_counter.items()):
-        print(f"🟡 {language} Url duplicates: {url} → ({nb_occurence + 1})")
+        warnings.append(f"🟡 {language} Url duplicates: {url} → ({nb_occurence + 1})")
         nb_warnings += nb_occurence
 
     if nb_warnings > 0:
-        print(f"🟡 {language} {nb_warnings} warnings found")
+        warnings.append(f"🟡 {language} {nb_warnings} warnings found")
+
+    return warnings
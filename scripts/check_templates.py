@@ -0,0 +1,45 @@
+from time import perf_counter
+
+from scripts.update_index import render_home_page, render_language_page
+from scripts.utils import get_languages
+from settings import language_flags, resize_image_from_width
+
+"""
+Vérifie que les pages (langues et accueil) rendues avec les templates minifiés
+à la compilation sont identiques, octet pour octet, à celles rendues avec les templates d'origine.
+
+    uv run main.py scripts/check_templates.py
+"""
+
+
+def main(**kwargs) -> None:
+    resize_image_from_width(24)
+    languages = sorted(set(get_languages()) & language_flags.keys())
+    used_language_flags = {k: v for k, v in language_flags.items() if k in languages}
+
+    different_pages = list()
+    for language in [*languages, ""]:
+        pages = dict()
+        durations = dict()
+        for minify_templates in (False, True):
+            start = perf_counter()
+            if language:
+                page_chunks, _, _ = render_language_page(
+                    language, used_language_flags, minify_templates=minify_templates
+                )
+            else:
+                page_chunks = render_home_page(
+                    used_language_flags, set(), set(), minify_templates=minify_templates
+                )
+            pages[minify_templates] = "".join(page_chunks)
+            durations[minify_templates] = perf_counter() - start
+
+        same = pages[False] == pages[True]
+        if not same:
+            different_pages.append(language or "home")
+        print(
+            f"{language or 'home':>5}: {'🟢' if same else '🔴'} "
+            f"{durations[False]:.2f} s → {durations[True]:.2f} s"
+        )
+
+    assert not different_pages, f"🔴 Different pages : {' ; '.join(different_pages)}"
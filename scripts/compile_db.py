@@ -0,0 +1,15 @@
+import logging
+
+from scripts.utils import ModManager
+
+logger = logging.getLogger(__name__)
+
+
+def main(**kwargs):
+    """
+    Compile db/mods.json, db/mods_{lang}.json et db/author_pseudos.json en un seul fichier binaire,
+    fusionné par langue et validé.
+    Tant qu'il est plus récent que ses sources, ModManager l'utilise à la place des json.
+    """
+    path = ModManager.compile()
+    logger.info(f"Compiled database: {path}")
@@ -1,14 +1,49 @@
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextvars import copy_context
+from functools import cache
+import hashlib
+from importlib.metadata import version
+import json
+from json import JSONDecodeError
 import logging
 from os import sep as os_sep
 from pathlib import Path
+import re
+import shutil
+from time import perf_counter
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
+from jinja2.ext import Extension
+from markupsafe import Markup
 import minify_html
 
-from i18n import LANGUAGE_CONFIG, TEMPLATE_TRANSLATIONS, _g
-from models.mod import ModStatus
-from scripts.utils import ModManager, get_languages
+import i18n
+from i18n import LANGUAGE_CONFIG, LOCALE_DIR, TEMPLATE_TRANSLATIONS, _g
+from models.mod import Mod, StatusMask, render_cache
+import models.utils
+from models.utils import atomic_write, write_json_atomic
+import scripts.utils
+from scripts.utils import (
+    ModManager,
+    get_jobs,
+    get_languages,
+    get_render_code_paths,
+    get_validation_code_paths,
+    hash_files,
+    map_languages,
+    profiler,
+)
 from settings import (
+    CACHE_PATH,
+    DB_PATH,
+    STATIC_PATH,
     CategoryEnum,
     GameEnum,
     attrs_icon_data,
@@ -19,74 +54,131 @@ from settings import (
 logger = logging.getLogger(__name__)
 
 home_page = "https://riwspy.github.io/lcc-docs/"
+changed_pages_filename = "changed_pages.txt"
+renderer_packages = ("jinja2", "markupsafe", "minify-html", "pydantic")
+# emplacement d'une ligne de mod dans le cadre de la page (bloc, comme la ligne elle-même)
+mod_row_placeholder = '<div data-mod-row="{mod_id}"></div>'
+mod_row_placeholder_regex = re.compile(r"<div data-mod-row=(?P<mod_id>\d+)></div>")
+# retours à la ligne et indentation des templates, réduits à une espace :
+# minify_html les traite comme l'indentation d'origine.
+# Après un bloc Jinja, trim_blocks retire déjà le premier retour à la ligne,
+# l'indentation qui suit n'est réduite que si elle reste dans le rendu.
+template_indent_regex = re.compile(r"(?:(?<=[^\s}])|(?<=}}))[ \t]*\n\s*")
+template_block_indent_regex = re.compile(r"(?<=%})\n\s+(?!\s|{%)")
 
 
 def main(**kwargs):
-    def build_html_page(**kwargs) -> str:
-        html_page = env.get_template("base.html").render(
-            games=GameEnum,
-            attrs_icon_data=attrs_icon_data,
-            language_flags=used_language_flags,
-            trans=TEMPLATE_TRANSLATIONS,
-            home_page=home_page,
-            **kwargs,
-        )
-        return minify_html.minify(html_page, minify_js=True, minify_css=True)
+    start = perf_counter()
+    profile = bool(kwargs.get("profile"))
+    if profile:
+        profiler.enable()
+    resize_image_from_width(24)
+    render_version = hash_files(get_render_code_paths())
 
-    env = Environment(
-        loader=PackageLoader("docs", "templates"),
-        autoescape=select_autoescape(["html"]),
-        trim_blocks=True,  # Supprime les retours à la ligne après un bloc Jinja
-        lstrip_blocks=True,  # Supprime les espaces avant un bloc Jinja
-        extensions=["jinja2.ext.i18n"],
-    )
-    env.install_gettext_callables(
-        gettext=_g,
-        ngettext=_g,
-        newstyle=True,
+    languages = sorted(set(get_languages()) & language_flags.keys())
+    used_language_flags = {k: v for k, v in language_flags.items() if k in languages}
+    dedupe = bool(kwargs.get("dedupe"))
+
+    # seules les pages dont les entrées ont changé sont régénérées, sauf avec --force
+    manifest = BuildManifest()
+    if kwargs.get("force"):
+        manifest.pages.clear()
+    options = {"dedupe": dedupe, "languages": languages}
+    page_hashes = {language: get_page_hash(language, **options) for language in languages}
+    outdated_languages = [
+        language
+        for language in languages
+        if not manifest.is_fresh(language, page_hashes[language])
+    ]
+    for language in sorted(set(languages) - set(outdated_languages)):
+        logger.info(f"Index page for {language} is up to date")
+
+    jobs = get_jobs(kwargs.get("jobs"), len(outdated_languages))
+    results = map_languages(
+        build_language_page,
+        outdated_languages,
+        used_language_flags,
+        render_version,
+        dedupe,
+        jobs=jobs,
+        initializer=init_render_process,
+        initargs=(profile,),
     )
 
-    resize_image_from_width(24)
+    changed_pages = list()
+    for language, (language_authors, language_team, changed, phases) in zip(
+        outdated_languages, results, strict=True
+    ):
+        if phases:
+            profiler.pages[language] = phases
+        if changed:
+            changed_pages.append(get_page_path(language))
+        manifest.pages[language] = {
+            "hash": page_hashes[language],
+            "authors": sorted(language_authors),
+            "team": sorted(language_team),
+        }
 
-    languages = set(get_languages()) & language_flags.keys()
-    used_language_flags = {k: v for k, v in language_flags.items() if k in languages}
+    # les auteurs et l'équipe des pages non régénérées proviennent du manifeste
     authors = set()
     team = set()
-
     for language in languages:
-        with LANGUAGE_CONFIG.switch_language(language):
-            mods = ModManager.get_mod_list(language)
+        authors.update(manifest.pages[language]["authors"])
+        team.update(manifest.pages[language]["team"])
 
-            mods.sort(key=lambda x: x.name.lower())
+    # on crée la page par defaut (home)
+    home_hash = get_page_hash("", **options, authors=sorted(authors), team=sorted(team))
+    if manifest.is_fresh("", home_hash):
+        logger.info("Index page for home is up to date")
+    else:
+        if build_home_page(used_language_flags, render_version, dedupe, authors, team):
+            changed_pages.append(get_page_path(""))
+        manifest.pages[""] = {"hash": home_hash}
 
-            mod_id_to_name = {mod.id: mod.name for mod in mods}
+    manifest.save()
+    write_changed_pages(changed_pages)
 
-            categories_mod = {cat: list() for cat in CategoryEnum}
-            for mod in mods:
-                if ModStatus.HIDDEN not in mod.status:
-                    for category in mod.categories:
-                        categories_mod[category].append(mod)
-                    authors |= set(mod.authors)
-                    team |= set(mod.team)
+    if profile:
+        path = profiler.save(
+            duration=perf_counter() - start,
+            jobs=jobs,
+            dedupe=dedupe,
+            built_pages=[*outdated_languages, *(["home"] if "home" in profiler.pages else [])],
+        )
+        summary = "\n".join(profiler.get_summary())
+        logger.info(f"Build profile: {path}\n{summary}")
 
-            page_html = build_html_page(
-                static=f"..{os_sep}static{os_sep}",
-                categories=categories_mod,
-                mod_length=len(mods),
-                language=language,
-                mod_id_to_name=mod_id_to_name,
-                is_home_page=False,
-            )
-            create_page_language(page_html, language)
 
-    # on crée la page par defaut (home)
+def build_home_page(
+    used_language_flags: dict[str, str],
+    render_version: str,
+    dedupe: bool,
+    authors: set[str],
+    team: set[str],
+) -> bool:
+    """Renvoie True si le contenu de la page a changé"""
+    with profiler.page("home"), profiler.phase("total"):
+        # la page d'accueil n'affiche qu'une partie des mods : le cache n'est pas sauvegardé
+        render_cache.load(CACHE_PATH / "render_en.json", render_version)
+        page_chunks = render_home_page(used_language_flags, authors, team, dedupe)
+        return create_page_language(page_chunks, "")
+
+
+def render_home_page(
+    used_language_flags: dict[str, str],
+    authors: set[str],
+    team: set[str],
+    dedupe: bool = False,
+    minify_templates: bool = True,
+) -> Iterator[str]:
+    """authors et team sont complétés avec ceux de tous les mods"""
     tp2_nb = 0
     translation_count = 0
     mod_per_game = {game.value: 0 for game in GameEnum}
     urls = set()
 
     with LANGUAGE_CONFIG.switch_language("en"):
-        mods = ModManager.get_mod_list("en")
+        mods = ModManager.get_mod_list("en", trusted=True)
         mod_id_to_name = {mod.id: mod.name for mod in mods}
 
         for mod in mods:
@@ -106,7 +198,10 @@ def main(**kwargs):
         without_tp2_mods = ModManager.get_without_tp2_mods(mods)
         missing_mods = ModManager.get_missing_mods(mods)
 
-        page_html = build_html_page(
+        return build_html_page(
+            used_language_flags,
+            dedupe,
+            minify_templates,
             static=f"static{os_sep}",
             is_home_page=True,
             mod_length=len(mods),
@@ -131,7 +226,288 @@ def main(**kwargs):
                 ),
             },
         )
-        create_page_language(page_html, "")
+
+
+def get_page_hash(language: str, **options) -> str:
+    """
+    Empreinte des entrées d'une page (language vide : page d'accueil) :
+    fichiers de la base lus, code, templates, catalogue, fichiers statiques,
+    versions des bibliothèques de rendu et options de génération
+    """
+    paths = [
+        *(
+            DB_PATH / ModManager.get_language_filename(lang)
+            for lang in dict.fromkeys(["", "en", language])
+        ),
+        DB_PATH / ModManager.author_pseudos_filename,
+        *get_validation_code_paths(),
+        *(Path(module.__file__ or "") for module in (models.utils, i18n, scripts.utils)),
+        Path(__file__),
+        *sorted((STATIC_PATH.parent / "templates").iterdir()),
+        *sorted(path for path in STATIC_PATH.rglob("*") if path.is_file()),
+    ]
+    catalog_path = Path.cwd() / LOCALE_DIR / (language or "en") / "LC_MESSAGES" / "messages.mo"
+    if catalog_path.exists():
+        paths.append(catalog_path)
+
+    # une mise à jour de ces bibliothèques (uv.lock) peut changer les octets générés
+    renderers = {name: version(name) for name in renderer_packages}
+
+    digest = hashlib.sha256(hash_files(paths).encode())
+    digest.update(json.dumps(options | {"renderers": renderers}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """
+    Empreinte des entrées de chaque page générée, avec les auteurs et l'équipe de chaque langue
+    (nécessaires à la page d'accueil quand la page de la langue n'est pas régénérée)
+    """
+
+    filename: str = "build_manifest.json"
+
+    def __init__(self) -> None:
+        self.path = CACHE_PATH / self.filename
+        self.pages: dict[str, dict] = self.load()
+
+    def load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("pages", {})
+        except (FileNotFoundError, JSONDecodeError):
+            return dict()
+
+    def save(self) -> None:
+        write_json_atomic(self.path, {"pages": self.pages}, ensure_ascii=False)
+
+    def is_fresh(self, language: str, page_hash: str) -> bool:
+        page = self.pages.get(language)
+        return (
+            page is not None and page["hash"] == page_hash and get_page_path(language).exists()
+        )
+
+
+def init_render_process(profile: bool = False) -> None:
+    if profile:
+        profiler.enable()
+    resize_image_from_width(24)
+
+
+class MinifyTemplateExtension(Extension):
+    """
+    Retire l'indentation des templates HTML une seule fois, à la compilation,
+    plutôt qu'à chaque rendu par minify_html
+    """
+
+    def preprocess(self, source: str, name: str | None, filename: str | None = None) -> str:
+        if name is None or not name.endswith(".html"):
+            return source
+        source = template_block_indent_regex.sub("\n ", source)
+        return template_indent_regex.sub(" ", source)
+
+
+@cache
+def get_environment(minify_templates: bool = True) -> Environment:
+    """
+    Environnement Jinja, un par process.
+    Les templates compilés sont gardés en cache sur disque entre deux builds.
+    """
+    extensions = ["jinja2.ext.i18n"]
+    if minify_templates:
+        extensions.append(MinifyTemplateExtension)
+    env = Environment(
+        loader=PackageLoader("docs", "templates"),
+        autoescape=select_autoescape(["html"]),
+        trim_blocks=True,  # Supprime les retours à la ligne après un bloc Jinja
+        lstrip_blocks=True,  # Supprime les espaces avant un bloc Jinja
+        extensions=extensions,
+        bytecode_cache=get_bytecode_cache(minify_templates),
+    )
+    env.install_gettext_callables(
+        gettext=_g,
+        ngettext=_g,
+        newstyle=True,
+    )
+    return env
+
+
+def get_bytecode_cache(minify_templates: bool) -> FileSystemBytecodeCache:
+    # Jinja ne compare que la source des templates : le code compilé dépend aussi
+    # du prétraitement et des options de l'environnement, définis dans ce fichier
+    variant = "minified" if minify_templates else "raw"
+    directory = CACHE_PATH / "jinja" / f"{variant}-{hash_files([Path(__file__)])[:12]}"
+    for old_directory in directory.parent.glob(f"{variant}-*"):
+        if old_directory != directory:
+            shutil.rmtree(old_directory, ignore_errors=True)
+    directory.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
+def build_html_page(
+    used_language_flags: dict[str, str],
+    dedupe: bool = False,
+    minify_templates: bool = True,
+    **kwargs,
+) -> Iterator[str]:
+    """
+    Renvoie la page minifiée par morceaux, à écrire au fur et à mesure.
+    Seul le cadre de la page (sans les lignes des mods) est rendu d'un bloc,
+    chaque ligne de mod est rendue et minifiée à la demande, à son emplacement.
+    dedupe : la ligne d'un mod n'est écrite que dans sa première catégorie,
+    les suivantes y font référence (<template> cloné à l'affichage)
+    minify_templates : templates débarrassés de leur indentation à la compilation,
+    la minification finale reste nécessaire mais a moins à faire
+    """
+    mods = dict()
+    mod_first_category = dict()
+    # nombre d'emplacements de la ligne de chaque mod dans la page
+    mod_row_counts: Counter[int] = Counter()
+    for category, category_mods in kwargs["categories"].items():
+        for mod in category_mods:
+            mods.setdefault(mod.id, mod)
+            mod_first_category.setdefault(mod.id, category)
+            if not dedupe or mod_first_category[mod.id] == category:
+                mod_row_counts[mod.id] += 1
+
+    with profiler.phase("render"):
+        html_frame = (
+            get_environment(minify_templates)
+            .get_template("base.html")
+            .render(
+                games=GameEnum,
+                attrs_icon_data=attrs_icon_data,
+                language_flags=used_language_flags,
+                trans=TEMPLATE_TRANSLATIONS,
+                home_page=home_page,
+                mod_rows={
+                    mod_id: Markup(mod_row_placeholder.format(mod_id=mod_id)) for mod_id in mods
+                },
+                dedupe_mods=dedupe,
+                mod_first_category=mod_first_category,
+                **kwargs,
+            )
+        )
+    with profiler.phase("minify"):
+        html_frame = minify_html.minify(html_frame, minify_js=True, minify_css=True)
+
+    # un emplacement non reconnu (ex : minifié autrement) donnerait une page sans ses mods
+    placeholder_count = sum(1 for _ in mod_row_placeholder_regex.finditer(html_frame))
+    assert placeholder_count == mod_row_counts.total(), (
+        f"{placeholder_count} mod row placeholders found, {mod_row_counts.total()} expected"
+    )
+
+    template = get_environment(minify_templates).get_template("mod.html")
+    # les lignes sont rendues à l'écriture de la page : dans le contexte (langue) de l'appelant
+    context = copy_context()
+    return iter_page_chunks(
+        html_frame,
+        mods,
+        mod_row_counts,
+        lambda mod: context.run(
+            render_mod_row,
+            template,
+            mod,
+            static=kwargs["static"],
+            trans=TEMPLATE_TRANSLATIONS,
+            mod_id_to_name=kwargs["mod_id_to_name"],
+        ),
+    )
+
+
+def iter_page_chunks(
+    html_frame: str,
+    mods: dict[int, Mod],
+    mod_row_counts: Counter[int],
+    render_row: Callable[[Mod], str],
+) -> Iterator[str]:
+    """
+    Insère les lignes des mods à leur emplacement dans le cadre de la page.
+    Une ligne n'est gardée en mémoire que si le mod apparaît encore plus loin dans la page.
+    """
+    remaining_counts = mod_row_counts.copy()
+    mod_rows: dict[int, str] = dict()
+    position = 0
+    for match in mod_row_placeholder_regex.finditer(html_frame):
+        yield html_frame[position : match.start()]
+        mod_id = int(match["mod_id"])
+        mod_row = mod_rows.pop(mod_id, None)
+        if mod_row is None:
+            mod_row = render_row(mods[mod_id])
+        remaining_counts[mod_id] -= 1
+        if remaining_counts[mod_id] > 0:
+            mod_rows[mod_id] = mod_row
+        yield mod_row
+        position = match.end()
+    yield html_frame[position:]
+
+
+def render_mod_row(template: Template, mod: Mod, **context) -> str:
+    """Rendu minifié de la ligne d'un mod"""
+    with profiler.phase("render"):
+        mod_row = template.render(mod=mod, **context)
+    with profiler.phase("minify"):
+        return minify_html.minify(mod_row, minify_js=True, minify_css=True)
+
+
+def build_language_page(
+    language: str,
+    used_language_flags: dict[str, str],
+    render_version: str,
+    dedupe: bool = False,
+) -> tuple[set[str], set[str], bool, dict[str, dict]]:
+    """
+    Génère la page d'une langue, éventuellement dans un process worker.
+    Renvoie les auteurs et l'équipe des mods affichés, si le contenu de la page a changé
+    et la mesure de chaque étape (vide sans --profile).
+    """
+    with profiler.page(language), profiler.phase("total"):
+        render_cache.load(CACHE_PATH / f"render_{language}.json", render_version)
+        page_chunks, authors, team = render_language_page(language, used_language_flags, dedupe)
+        changed = create_page_language(page_chunks, language)
+        render_cache.save()
+
+    return authors, team, changed, profiler.pages.get(language, dict())
+
+
+def render_language_page(
+    language: str,
+    used_language_flags: dict[str, str],
+    dedupe: bool = False,
+    minify_templates: bool = True,
+) -> tuple[Iterator[str], set[str], set[str]]:
+    authors = set()
+    team = set()
+
+    with LANGUAGE_CONFIG.switch_language(language):
+        mods = ModManager.get_mod_list(language, trusted=True)
+
+        with profiler.phase("sort"):
+            mods.sort(key=lambda x: x.name.lower())
+
+        mod_id_to_name = {mod.id: mod.name for mod in mods}
+
+        with profiler.phase("categorization"):
+            categories_mod = {cat: list() for cat in CategoryEnum}
+            for mod in mods:
+                if not mod.status_mask & StatusMask.HIDDEN:
+                    for category in mod.categories:
+                        categories_mod[category].append(mod)
+                    authors |= set(mod.authors)
+                    team |= set(mod.team)
+
+        page_chunks = build_html_page(
+            used_language_flags,
+            dedupe,
+            minify_templates,
+            static=f"..{os_sep}static{os_sep}",
+            categories=categories_mod,
+            mod_length=len(mods),
+            language=language,
+            mod_id_to_name=mod_id_to_name,
+            is_home_page=False,
+        )
+
+    return page_chunks, authors, team
 
 
 class HomeCategory:
@@ -140,15 +516,55 @@ class HomeCategory:
         self.value = value
 
 
-def create_page_language(page_html: str, language: str) -> None:
+def get_page_path(language: str) -> Path:
     dir_path = Path.cwd() / "docs"
     if language:
         dir_path /= language
-    dir_path.mkdir(parents=True, exist_ok=True)
+    return dir_path / "index.html"
+
+
+def create_page_language(page_chunks: Iterable[str], language: str) -> bool:
+    """
+    Écrit la page au fur et à mesure dans un fichier temporaire, qui ne remplace l'existant
+    que si son contenu a changé : le fichier garde sinon sa date de modification.
+    Renvoie True si la page a été écrite.
+    """
+    index_page = get_page_path(language)
+    try:
+        with open(index_page, "rb") as f:
+            previous_digest = hashlib.file_digest(f, "sha256").digest()
+    except FileNotFoundError:
+        previous_digest = None
+
+    digest = hashlib.sha256()
+    with (
+        profiler.phase("write"),
+        atomic_write(
+            index_page, "wb", should_replace=lambda: digest.digest() != previous_digest
+        ) as f,
+    ):
+        for chunk in page_chunks:
+            content = chunk.encode("utf-8")
+            digest.update(content)
+            f.write(content)
+
+    if digest.digest() == previous_digest:
+        logger.info(f"Index page for {language or 'home'} unchanged")
+        return False
 
-    index_page = dir_path / "index.html"
     logger.info(
         f"Generating index page for {language or 'home'}: \x1b]8;;{index_page}\x1b\\{index_page}\x1b]8;;\x1b\\",
     )
-    with open(index_page, "w", encoding="utf-8") as f:
-        f.write(page_html)
+    return True
+
+
+def write_changed_pages(changed_pages: list[Path]) -> None:
+    """
+    Liste des pages réellement modifiées par cette génération, une par ligne,
+    pour les étapes suivantes (compression, déploiement…)
+    """
+    if changed_pages:
+        logger.info(f"Changed pages: {', '.join(str(page) for page in changed_pages)}")
+    CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH / changed_pages_filename, "w", encoding="utf-8") as f:
+        f.writelines(f"{page}\n" for page in changed_pages)
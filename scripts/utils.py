@@ -1,19 +1,98 @@
-from dataclasses import fields
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+import hashlib
+from itertools import repeat
 import json
 from json import JSONDecodeError
 import logging
+import marshal
 import os
+from pathlib import Path
+import pickle
+from sys import intern
+from time import perf_counter
+import tracemalloc
 
-from i18n import LANGUAGE_DEFAULT, current_language
-from models.mod import Mod, ModStatus
-from settings import DB_PATH
+from i18n import LANGUAGE_DEFAULT, LOCALE_DIR, current_language
+import models.mod
+from models.mod import Mod, StatusMask
+import models.url
+import models.utils
+from models.utils import atomic_write, write_json_atomic
+import settings
+from settings import CACHE_PATH, DB_PATH
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class ModLayer:
+    data: dict
+    exclude_fields: frozenset[str]
+    # champ → champ dont le contenu lui est ajouté, ex : urls → urls_extra
+    merge_fields: dict[str, str]
+
+
+class LayeredMod(Mapping):
+    """
+    Mod vu à travers ses couches de traduction (source → en → langue) sans aucune copie :
+    chaque champ est résolu à la lecture, de la couche la plus haute vers la source.
+    Une couche ne surcharge un champ que si sa valeur est renseignée.
+    """
+
+    __slots__ = ("base", "layers")
+
+    def __init__(self, base: Mapping, layers: tuple[ModLayer, ...] = ()) -> None:
+        self.base = base
+        self.layers = layers
+
+    def overlay(self, layer: ModLayer) -> "LayeredMod":
+        return LayeredMod(self.base, self.layers + (layer,))
+
+    def _resolve(self, key: str, depth: int):
+        if depth == 0:
+            return self.base[key]
+
+        layer = self.layers[depth - 1]
+        value = None if key in layer.exclude_fields else layer.data.get(key)
+        if not value:
+            value = self._resolve(key, depth - 1)
+
+        extra_key = layer.merge_fields.get(key)
+        if extra_key is not None:
+            try:
+                value = value + self._resolve(extra_key, depth)
+            except KeyError:
+                pass
+        return value
+
+    def __getitem__(self, key: str):
+        return self._resolve(key, len(self.layers))
+
+    def __iter__(self) -> Iterator[str]:
+        keys = dict.fromkeys(self.base)
+        for layer in self.layers:
+            keys.update(
+                (k, None) for k, v in layer.data.items() if v and k not in layer.exclude_fields
+            )
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 class ModManager:
     mod_filename: str = "mods.json"
     mod_filename_lang: str = "mods_{lang}.json"
+    author_pseudos_filename: str = "author_pseudos.json"
+    compiled_filename: str = "mods.pickle"
+    compiled_version: int = 2
+    # cache process-wide : chemin → ((mtime_ns, size), contenu décodé)
+    _snapshots: dict[Path, tuple[tuple[int, int], list[dict]]] = dict()
+    _compiled: tuple[tuple[int, int], dict] | None = None
+    validation_stamp_filename: str = "validation_stamp.json"
 
     @classmethod
     def get_language_filename(cls, language: str | None = None) -> str:
@@ -25,18 +104,52 @@ class ModManager:
 
     @classmethod
     def load(cls, language: str | None = None) -> list[dict]:
-        filename = cls.get_language_filename(language=language)
+        """
+        Renvoie une copie du contenu du fichier, modifiable sans risque pour le cache
+        """
+        return copy_json(cls.get_snapshot(language=language))
+
+    @classmethod
+    def preload(cls, languages: list[str]) -> dict[Path, tuple[tuple[int, int], list[dict]]]:
+        for language in languages:
+            cls.get_snapshot(language=language)
+        return dict(cls._snapshots)
+
+    @classmethod
+    def set_snapshots(cls, snapshots: dict[Path, tuple[tuple[int, int], list[dict]]]) -> None:
+        """
+        Partage des données déjà décodées, ex : avec un process worker
+        """
+        cls._snapshots.update(snapshots)
+
+    @classmethod
+    def get_snapshot(cls, language: str | None = None) -> list[dict]:
+        """
+        Renvoie le contenu décodé du fichier, partagé par tous les appelants : lecture seule !
+        Chaque fichier n'est décodé qu'une fois par process, tant qu'il n'est pas modifié.
+        """
+        path = DB_PATH / cls.get_language_filename(language=language)
 
         try:
-            with open(DB_PATH / filename, "r", encoding="utf-8") as f:
-                return json.load(f)
+            stat = path.stat()
         except FileNotFoundError as e:
-            logging.error(f"File not found {DB_PATH / filename}")
+            logging.error(f"File not found {path}")
             raise e
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._snapshots.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with profiler.phase("json_load"), open(path, "r", encoding="utf-8") as f:
+                mods = intern_mods(json.load(f))
         except JSONDecodeError as e:
-            logging.error(f"Error decoding {DB_PATH / filename}")
+            logging.error(f"Error decoding {path}")
             raise e
-        return list()
+
+        cls._snapshots[path] = (stamp, mods)
+        return mods
 
     @classmethod
     def export(cls, mods: dict | list, language: str | None = None) -> None:
@@ -45,69 +158,247 @@ class ModManager:
         filename = cls.get_language_filename(language=language)
         with open(DB_PATH / filename, "w", encoding="utf-8") as f:
             json.dump(mods, f, indent=4, ensure_ascii=False)
+        cls._snapshots.pop(DB_PATH / filename, None)
 
     @classmethod
     def get_default_mods(cls) -> list[dict]:
         return cls.load(language="")
 
     @classmethod
-    def get_mod_list(
-        cls, language: str | None = None, default_mods: list[dict] | None = None
-    ) -> list[Mod]:
+    def get_source_paths(cls) -> list[Path]:
+        """
+        Fichiers à partir desquels la base compilée est construite
+        """
+        return [
+            DB_PATH / cls.mod_filename,
+            DB_PATH / cls.author_pseudos_filename,
+            *(DB_PATH / cls.get_language_filename(language) for language in get_languages()),
+        ]
+
+    @classmethod
+    def get_compiled(cls) -> dict | None:
+        """
+        Renvoie la base compilée par `scripts/compile_db.py`,
+        None si elle est absente, plus ancienne que l'un des fichiers sources
+        ou construite par une autre version du code (fusion, normalisation, validation)
+        """
+        path = DB_PATH / cls.compiled_filename
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        source_paths = cls.get_source_paths()
+        if any(
+            source_path.stat().st_mtime_ns > stat.st_mtime_ns for source_path in source_paths
+        ):
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if cls._compiled is None or cls._compiled[0] != stamp:
+            with profiler.phase("compiled_load"), open(path, "rb") as f:
+                cls._compiled = (stamp, pickle.load(f))
+
+        compiled = cls._compiled[1]
+        if (
+            compiled.get("version") != cls.compiled_version
+            or compiled.get("code_hash") != cls.get_compiled_code_hash()
+            or compiled.get("sources") != [source_path.name for source_path in source_paths]
+        ):
+            return None
+        return compiled
+
+    @classmethod
+    def get_compiled_code_hash(cls) -> str:
+        return hash_files(
+            [Path(__file__), *get_validation_code_paths(), Path(models.utils.__file__ or "")]
+        )
+
+    @classmethod
+    def is_compiled_validated(cls, language: str) -> bool:
+        """
+        Mods de la langue validés par `ModManager.compile`, inutile de les valider à nouveau
+        """
+        compiled = cls.get_compiled()
+        return (
+            compiled is not None
+            and compiled.get("validated") is True
+            and language in compiled["languages"]
+        )
+
+    @classmethod
+    def compile(cls) -> Path:
+        """
+        Fusionne et valide chaque langue puis enregistre le tout dans un unique fichier binaire
+        """
+        source_lists = {
+            language: [dict(mod) for mod in cls.get_source_list(language, use_compiled=False)]
+            for language in ["", *get_languages()]
+        }
+        for source_list in source_lists.values():
+            Mod.validate_many(source_list)
+
+        compiled = {
+            "version": cls.compiled_version,
+            "code_hash": cls.get_compiled_code_hash(),
+            "sources": [source_path.name for source_path in cls.get_source_paths()],
+            "languages": source_lists,
+            # les mods ont passé la validation ci-dessus, cf. `ModManager.is_compiled_validated`
+            "validated": True,
+        }
+        path = DB_PATH / cls.compiled_filename
+        with atomic_write(path, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        cls._compiled = None
+        return path
+
+    @classmethod
+    def get_source_list(
+        cls,
+        language: str | None = None,
+        default_mods: list[dict] | None = None,
+        *,
+        use_compiled: bool = True,
+    ) -> list[Mapping]:
+        """
+        Renvoie les données fusionnées (source, en puis langue) des mods, en lecture seule
+        """
         if default_mods is None:
-            default_mods = cls.get_default_mods()
+            compiled = cls.get_compiled() if use_compiled else None
+            if compiled is not None and (language or "") in compiled["languages"]:
+                return compiled["languages"][language or ""]
+            default_mods = cls.get_snapshot(language="")
 
         if not language:
-            source_list = default_mods
-        elif language in (LANGUAGE_DEFAULT, "en"):
-            source_list = cls.get_combine_language(
-                default_mods, language, merge_urls_extra=True, merge_notes_extra=True
-            )
-        else:
+            return default_mods
+
+        # les couches ne sont résolues qu'à la lecture des champs, cf. `LayeredMod`
+        with profiler.phase("overlay_merge"):
+            if language in (LANGUAGE_DEFAULT, "en"):
+                return cls.get_combine_language(
+                    default_mods, language, merge_urls_extra=True, merge_notes_extra=True
+                )
+
             source_list = cls.get_combine_language(
                 default_mods, "en", exclude_fields=["team", "translation_state"]
             )
-            source_list = cls.get_combine_language(
+            return cls.get_combine_language(
                 source_list, language, merge_urls_extra=True, merge_notes_extra=True
             )
 
-        return [Mod(**mod) for mod in source_list]
+    @classmethod
+    def get_mod_list(
+        cls,
+        language: str | None = None,
+        default_mods: list[dict] | None = None,
+        *,
+        trusted: bool = False,
+        compact: bool = False,
+    ) -> list[Mod]:
+        """
+        trusted : si `scripts/check_mods_json.py` a validé ces mêmes données,
+        les mods sont construits sans validation
+        (de même, sans condition, pour les mods de la base compilée)
+        compact : stockage compact des mods (tuples), cf. `Mod.compact`
+        """
+        source_list = cls.get_source_list(language, default_mods)
+        with profiler.phase("mod_validation"):
+            if default_mods is None and (
+                (trusted and cls.is_validated(language or ""))
+                or cls.is_compiled_validated(language or "")
+            ):
+                mods = [Mod.construct(mod) for mod in source_list]
+                return [mod.compact() for mod in mods] if compact else mods
+
+            # seuls les mods nouveaux ou modifiés depuis la dernière validation sont validés
+            records = [mod if isinstance(mod, dict) else dict(mod) for mod in source_list]
+            validation_cache = ValidationCache(language or "")
+            record_hashes = [ValidationCache.get_record_hash(record) for record in records]
+            validated_mods = iter(
+                Mod.validate_many(
+                    record
+                    for record, record_hash in zip(records, record_hashes, strict=True)
+                    if record_hash not in validation_cache.hashes
+                )
+            )
+            mods = [
+                Mod.construct(record)
+                if record_hash in validation_cache.hashes
+                else next(validated_mods)
+                for record, record_hash in zip(records, record_hashes, strict=True)
+            ]
+            validation_cache.save(set(record_hashes))
+            return [mod.compact() for mod in mods] if compact else mods
+
+    @classmethod
+    def get_inputs_hash(cls) -> str:
+        """
+        Empreinte des données (db) et des règles de validation (models, settings)
+        """
+        return hash_files([*cls.get_source_paths(), *get_validation_code_paths()])
+
+    @classmethod
+    def write_validation_stamp(cls, languages: list[str]) -> None:
+        write_json_atomic(
+            CACHE_PATH / cls.validation_stamp_filename,
+            {"hash": cls.get_inputs_hash(), "languages": languages},
+        )
+
+    @classmethod
+    def is_validated(cls, language: str) -> bool:
+        try:
+            with open(CACHE_PATH / cls.validation_stamp_filename, "r", encoding="utf-8") as f:
+                stamp = json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            return False
+
+        return (
+            language in stamp.get("languages", ())
+            and stamp.get("hash") == cls.get_inputs_hash()
+        )
 
     @classmethod
     def get_combine_language(
         cls,
-        source_list: list[dict],
+        source_list: list[Mapping],
         language_target: str,
         *,
         exclude_fields: None | list[str] = None,
         merge_urls_extra: bool = False,
         merge_notes_extra: bool = False,
-    ) -> list[dict]:
-        target_list = cls.load(language_target)
+    ) -> list[Mapping]:
+        layer = ModLayer(
+            data=dict(),
+            exclude_fields=frozenset(exclude_fields or ()),
+            merge_fields={
+                attr: extra_attr
+                for attr, extra_attr, merge in (
+                    ("urls", "urls_extra", merge_urls_extra),
+                    ("notes", "notes_extra", merge_notes_extra),
+                )
+                if merge
+            },
+        )
         source_list_pks = {mod["id"]: mod for mod in source_list}
-        for mod_dict in target_list:
+        for mod_dict in cls.get_snapshot(language_target):
             pk = mod_dict["id"]
-
-            source_list_pks[pk] |= {
-                k: v
-                for k, v in mod_dict.items()
-                if v and (exclude_fields is None or k not in exclude_fields)
-            }
-            if merge_urls_extra and "urls_extra" in source_list_pks[pk]:
-                source_list_pks[pk]["urls"] += source_list_pks[pk]["urls_extra"]
-            if merge_notes_extra and "notes_extra" in source_list_pks[pk]:
-                source_list_pks[pk]["notes"] += source_list_pks[pk]["notes_extra"]
+            source_mod = source_list_pks[pk]
+            if not isinstance(source_mod, LayeredMod):
+                source_mod = LayeredMod(source_mod)
+            source_list_pks[pk] = source_mod.overlay(replace(layer, data=mod_dict))
         return list(source_list_pks.values())
 
     @classmethod
     def get_last_added_mods(cls, mods: list[Mod], nb: int = 10) -> list[Mod]:
-        not_hidden_mods = [mod for mod in mods if ModStatus.HIDDEN not in mod.status]
+        not_hidden_mods = [mod for mod in mods if not mod.status_mask & StatusMask.HIDDEN]
         return not_hidden_mods[-nb:][::-1]
 
     @classmethod
     def get_last_updated_mods(cls, mods: list[Mod], nb: int = 10) -> list[Mod]:
         active_mods = [
-            mod for mod in mods if not mod.status & {ModStatus.UNRELEASED, ModStatus.HIDDEN}
+            mod
+            for mod in mods
+            if not mod.status_mask & (StatusMask.UNRELEASED | StatusMask.HIDDEN)
         ]
         active_mods.sort(key=lambda x: x.last_update)
         return active_mods[-nb:][::-1]
@@ -117,22 +408,145 @@ class ModManager:
         return [
             mod
             for mod in mods
-            if ModStatus.MISSING in mod.status and ModStatus.EMBED not in mod.status
+            if (mod.status_mask & (StatusMask.MISSING | StatusMask.EMBED)) == StatusMask.MISSING
         ]
 
     @classmethod
     def get_without_author_mods(cls, mods: list[Mod]) -> list[Mod]:
-        return [mod for mod in mods if not mod.authors and ModStatus.HIDDEN not in mod.status]
+        return [
+            mod for mod in mods if not mod.authors and not mod.status_mask & StatusMask.HIDDEN
+        ]
 
     @classmethod
     def get_without_tp2_mods(cls, mods: list[Mod]) -> list[Mod]:
         return [
             mod
             for mod in mods
-            if not mod.tp2 and not mod.status & {ModStatus.HIDDEN, ModStatus.UNRELEASED}
+            if not mod.tp2 and not mod.status_mask & (StatusMask.HIDDEN | StatusMask.UNRELEASED)
         ]
 
 
+class ValidationCache:
+    """
+    Empreintes des mods (fusionnés) d'une langue ayant passé la validation, persistées sur disque.
+    Le cache est invalidé dès que les règles de validation changent.
+    """
+
+    filename: str = "validation_{lang}.json"
+
+    def __init__(self, language: str) -> None:
+        self.path = CACHE_PATH / self.filename.format(lang=language or "source")
+        self.code_hash = hash_files(get_validation_code_paths())
+        self.hashes: set[str] = self.load()
+
+    def load(self) -> set[str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, JSONDecodeError):
+            return set()
+
+        if data.get("code_hash") != self.code_hash:
+            return set()
+        return set(data.get("records", ()))
+
+    def save(self, hashes: set[str]) -> None:
+        if hashes == self.hashes:
+            return
+
+        self.hashes = hashes
+        write_json_atomic(self.path, {"code_hash": self.code_hash, "records": sorted(hashes)})
+
+    @staticmethod
+    def get_record_hash(record: dict) -> str:
+        # marshal version 2 : pas de références internes, les octets ne dépendent que du contenu
+        return hashlib.blake2b(marshal.dumps(record, 2), digest_size=16).hexdigest()
+
+
+class PhaseProfiler:
+    """
+    Durée et pic d'allocation mémoire (tracemalloc) de chaque étape du build, par page.
+    Inactif par défaut : les étapes ne sont alors pas mesurées.
+    Les étapes peuvent s'imbriquer : durée et pic d'une étape incluent ceux de ses sous-étapes,
+    `self_duration` exclut le temps passé dans les sous-étapes (ex. rendu des lignes dans "write").
+    """
+
+    filename: str = "build_profile.json"
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.pages: dict[str, dict[str, dict]] = dict()
+        self.current_page = "main"
+        # [mémoire allouée au début, pic, durée des sous-étapes] des étapes en cours
+        self._stack: list[list] = list()
+
+    def enable(self) -> None:
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def page(self, name: str) -> Iterator[None]:
+        previous_page, self.current_page = self.current_page, name
+        try:
+            yield
+        finally:
+            self.current_page = previous_page
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        self._update_peaks()
+        memory = tracemalloc.get_traced_memory()[0]
+        self._stack.append([memory, memory, 0.0])
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self._update_peaks()
+            memory, peak, children_duration = self._stack.pop()
+            if self._stack:
+                self._stack[-1][2] += duration
+            stats = self.pages.setdefault(self.current_page, dict()).setdefault(
+                name, {"calls": 0, "duration": 0.0, "self_duration": 0.0, "peak_memory": 0}
+            )
+            stats["calls"] += 1
+            stats["duration"] += duration
+            stats["self_duration"] += duration - children_duration
+            stats["peak_memory"] = max(stats["peak_memory"], peak - memory)
+
+    def _update_peaks(self) -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        for stats in self._stack:
+            stats[1] = max(stats[1], peak)
+        tracemalloc.reset_peak()
+
+    def save(self, **infos) -> Path:
+        """Rapport JSON, pour suivre l'évolution du build d'une exécution à l'autre"""
+        path = CACHE_PATH / self.filename
+        write_json_atomic(path, infos | {"pages": self.pages}, indent=4)
+        return path
+
+    def get_summary(self) -> list[str]:
+        """Par étape : durée totale, durée propre (hors sous-étapes), pic mémoire et nombre d'appels"""
+        lines = [f"    {'étape':<15} {'durée':>10} {'propre':>10} {'pic':>12}  appels"]
+        for page, phases in self.pages.items():
+            lines.append(f"{page}:")
+            for name, stats in phases.items():
+                lines.append(
+                    f"    {name:<15} {stats['duration']:>8.3f} s {stats['self_duration']:>8.3f} s "
+                    f"{stats['peak_memory'] / 2**20:>8.1f} Mio  x{stats['calls']}"
+                )
+        return lines
+
+
+profiler = PhaseProfiler()
+
+
 class CleanModMixin:
     def __init__(self, data: dict):
         self.data = data
@@ -150,6 +564,40 @@ class CleanModMixin:
                     self.cleaned_data[attr] = cleaned_value
 
 
+def intern_json(data):
+    """
+    Remplace chaque chaîne (clés comprises) par son exemplaire unique, cf. `sys.intern` :
+    une même chaîne présente dans plusieurs fichiers n'est gardée qu'une fois en mémoire
+    """
+    data_type = type(data)
+    if data_type is str:
+        return intern(data)
+    if data_type is list:
+        return [intern_json(value) for value in data]
+    if data_type is dict:
+        return {intern(key): intern_json(value) for key, value in data.items()}
+    return data
+
+
+def intern_mods(mods: list[dict]) -> list[dict]:
+    """
+    Normalise les pseudos des auteurs (cf. AUTHOR_PSEUDOS) puis partage les chaînes des mods
+    """
+    for mod in mods:
+        if authors := mod.get("authors"):
+            mod["authors"] = list(
+                dict.fromkeys(AUTHOR_PSEUDOS.get(author, author) for author in authors)
+            )
+    return intern_json(mods)
+
+
+def copy_json(data: list | dict) -> list | dict:
+    """
+    Copie profonde rapide d'une donnée issue d'un json (dict, list, str, int, float, bool, None)
+    """
+    return marshal.loads(marshal.dumps(data))
+
+
 def simplify_url(url: str) -> str:
     if (
         url.startswith("https://github.com")
@@ -162,12 +610,72 @@ def simplify_url(url: str) -> str:
     return url.removesuffix("/")
 
 
-with open(DB_PATH / "author_pseudos.json", "r", encoding="utf-8") as f:
-    author_pseudos = json.load(f)
+def get_validation_code_paths() -> list[Path]:
+    return [Path(module.__file__ or "") for module in (models.mod, models.url, settings)]
+
+
+def get_render_code_paths() -> list[Path]:
+    """Fichiers dont dépend le rendu HTML des descriptions et notes (code et traductions)"""
+    return [
+        *get_validation_code_paths(),
+        Path(models.utils.__file__ or ""),
+        *sorted((Path.cwd() / LOCALE_DIR).glob("*/LC_MESSAGES/*.mo")),
+    ]
+
+
+# cache process-wide : ((chemin, mtime_ns, size), …) → empreinte
+_files_hashes: dict[tuple, str] = dict()
 
-AUTHOR_PSEUDOS: dict[str, tuple[str]] = {
-    pseudo: k for k, pseudos in author_pseudos.items() for pseudo in pseudos
-}
+
+def hash_files(paths: list[Path]) -> str:
+    stats = tuple((path, path.stat().st_mtime_ns, path.stat().st_size) for path in paths)
+    if stats not in _files_hashes:
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        _files_hashes[stats] = digest.hexdigest()
+    return _files_hashes[stats]
+
+
+def get_jobs(jobs: int | None, tasks: int) -> int:
+    """Nombre de process (par défaut : nombre de cœurs), jamais plus que de tâches"""
+    return min(jobs or os.cpu_count() or 1, tasks)
+
+
+def map_languages(
+    function: Callable,
+    languages: list[str],
+    *args,
+    jobs: int | None = None,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> list:
+    """
+    Appelle function(language, *args) pour chaque langue, dans des process workers si jobs > 1.
+    Les résultats sont dans l'ordre des langues : sortie identique d'une exécution à l'autre.
+    initializer(*initargs) est appelé dans chaque worker (ex : réglages du process).
+    """
+    jobs = get_jobs(jobs, len(languages))
+    if jobs <= 1:
+        return [function(language, *args) for language in languages]
+
+    # décodées une seule fois ici, les données sont partagées avec les workers
+    snapshots = ModManager.preload(["", "en", *languages])
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_language_process,
+        initargs=(snapshots, initializer, initargs),
+    ) as executor:
+        return list(executor.map(function, languages, *(repeat(arg) for arg in args)))
+
+
+def init_language_process(
+    snapshots: dict, initializer: Callable | None = None, initargs: tuple = ()
+) -> None:
+    ModManager.set_snapshots(snapshots)
+    if initializer is not None:
+        initializer(*initargs)
 
 
 def get_languages() -> list[str]:
@@ -178,3 +686,16 @@ def get_languages() -> list[str]:
             for f in it
             if f.is_file() and f.name.endswith(".json") and f.name.startswith("mods_")
         )
+
+
+def load_author_pseudos() -> dict[str, list[str]]:
+    # petit fichier json : la base compilée n'est pas chargée à l'import du module
+    with open(DB_PATH / ModManager.author_pseudos_filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+author_pseudos = load_author_pseudos()
+
+AUTHOR_PSEUDOS: dict[str, tuple[str]] = {
+    pseudo: k for k, pseudos in author_pseudos.items() for pseudo in pseudos
+}
@@ -5,6 +5,8 @@ from i18n import _g
 from models.utils import slugify
 
 DB_PATH: Path = Path.cwd() / "db"
+CACHE_PATH: Path = Path.cwd() / ".cache"
+STATIC_PATH: Path = Path(__file__).parent / "docs" / "static"
 FLAG_DIR: Path = Path("img") / "flags"
 SITE_DIR: Path = Path("img") / "sites"
 
@@ -0,0 +1,12 @@
+import pytest
+
+from scripts.utils import ModManager
+
+
+@pytest.fixture
+def db_path(tmp_path, mocker):
+    mocker.patch("scripts.utils.DB_PATH", tmp_path)
+    mocker.patch.object(ModManager, "_snapshots", dict())
+    mocker.patch.object(ModManager, "_compiled", None)
+    mocker.patch("scripts.utils.CACHE_PATH", tmp_path / ".cache")
+    return tmp_path
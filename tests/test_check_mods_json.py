@@ -0,0 +1,28 @@
+from scripts.check_mods_json import main
+from tests.test_mod import mod_kwargs
+from tests.test_utils import write_db
+
+
+class TestCheckModsJson:
+    def test_main_jobs(self, db_path, capsys):
+        url = "https://toto.com/"
+        write_db(
+            db_path,
+            [
+                mod_kwargs | {"id": 1, "games": [], "status": [], "urls": [url], "tp2": "a"},
+                mod_kwargs | {"id": 2, "games": [], "status": [], "urls": [url], "tp2": "b"},
+            ],
+        )
+        for language in ("en", "fr", "pl"):
+            write_db(db_path, [{"id": 1, "languages": [f"x{language}"]}], language=language)
+        (db_path / "author_pseudos.json").write_text("{}")
+
+        main(jobs=1)
+        expected_value = capsys.readouterr().out
+        main(jobs=2)
+
+        assert capsys.readouterr().out == expected_value
+        # avertissements dans l'ordre des langues
+        assert [line.split()[1] for line in expected_value.splitlines()[:-1]] == [
+            language for language in ("en", "fr", "pl") for _ in range(3)
+        ]
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from i18n import LANGUAGE_CONFIG, _g, current_language, get_catalog
+
+
+class TestI18n:
+    def test_catalog_loaded_once(self):
+        assert get_catalog("en") is get_catalog("en")
+
+    def test_switch_language(self):
+        language = current_language()
+
+        with LANGUAGE_CONFIG.switch_language("en"):
+            assert current_language() == "en"
+            assert _g("Mod de qualité") == "Quality mod"
+
+        assert current_language() == language
+        assert _g("Mod de qualité") == "Mod de qualité"
+
+    def test_switch_language_threads(self):
+        barrier = Barrier(2)
+
+        def translate(language: str) -> tuple[str, str]:
+            with LANGUAGE_CONFIG.switch_language(language):
+                # les deux langues sont actives en même temps
+                barrier.wait()
+                return current_language(), _g("Mod de qualité")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(translate, ["en", "fr"]))
+
+        assert results == [("en", "Quality mod"), ("fr", "Mod de qualité")]
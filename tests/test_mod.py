@@ -1,9 +1,12 @@
+from dataclasses import asdict
+
 from pydantic import ValidationError
 import pytest
 
 from i18n import LanguageConfig
-from models.mod import Mod, ModStatus
-from settings import TranslationStateEnum
+from models.mod import GameMask, Mod, ModStatus, StatusMask
+from models.utils import RenderCache
+from settings import GameEnum, TranslationStateEnum, attrs_icon_data
 
 mod_kwargs = {
     "id": 1,
@@ -34,6 +37,13 @@ def mod(**kwargs):
     return create_mod_instance(**kwargs)
 
 
+@pytest.fixture
+def render_cache(mocker):
+    cache = RenderCache()
+    mocker.patch("models.mod.render_cache", cache)
+    return cache
+
+
 class TestMod:
     def test_mod_base(self):
         create_mod_instance()
@@ -46,6 +56,36 @@ class TestMod:
         with pytest.raises(ValidationError):
             create_mod_instance(last_update="2025-24")
 
+    def test_mod_validate_many(self):
+        mods = Mod.validate_many([mod_kwargs, mod_kwargs | {"id": 2}])
+
+        assert [mod.id for mod in mods] == [1, 2]
+
+    def test_mod_validate_many_last_update_validator_date(self):
+        with pytest.raises(ValidationError):
+            Mod.validate_many([mod_kwargs | {"last_update": "2999-01-01"}])
+
+    def test_mod_construct(self):
+        record = mod_kwargs | {"games": ["BGEE"], "categories": ["Kit"], "status": ["stable"]}
+        expected_value = asdict(Mod(**record))
+
+        assert asdict(Mod.construct(record)) == expected_value
+
+    def test_mod_compact(self):
+        mod = create_mod_instance(notes=["a"], compatibilities={"requires": [2]}).compact()
+
+        assert mod.notes == ("a",)
+        assert mod.team == ()
+        assert mod.compatibilities == {"requires": (2,)}
+        assert mod.get_notes() == ["a"]
+
+    def test_mod_compact_shared_empty(self):
+        mod1 = create_mod_instance().compact()
+        mod2 = create_mod_instance().compact()
+
+        assert mod1.team is mod2.team
+        assert mod1.compatibilities is mod2.compatibilities
+
     def test_mod_translation_state_auto1(self):
         mod = create_mod_instance(translation_state=TranslationStateEnum.AUTO, languages=list())
         expected_value = TranslationStateEnum.TODO
@@ -69,6 +109,39 @@ class TestMod:
 
         assert mod.translation_state_auto == expected_value
 
+    def test_mod_memoized_property(self):
+        mod = create_mod_instance(games={"BGEE", "BG2"})
+
+        assert mod.games_ordered is mod.games_ordered
+
+    def test_mod_icons_shared(self):
+        mod1 = create_mod_instance(tp2="toto")
+        mod2 = create_mod_instance(tp2="titi")
+
+        assert len(mod1.icons) == len(attrs_icon_data)
+        assert all(icon1 is icon2 for icon1, icon2 in zip(mod1.icons, mod2.icons, strict=True))
+
+    def test_mod_icons_translated(self):
+        mod = create_mod_instance(safe=2)
+
+        with LanguageConfig().switch_language("en"):
+            assert mod.icons[0].label == "Quality mod"
+
+    def test_mod_masks(self):
+        mod = create_mod_instance(games={"BGEE", "BG2"}, status=["hidden"])
+
+        assert mod.games_mask == GameMask.BGEE | GameMask.BG2
+        assert mod.games_mask & GameMask.EE
+        assert mod.status_mask == StatusMask.HIDDEN
+        assert mod.games == {GameEnum.BGEE, GameEnum.BG2}
+
+    def test_mod_flag_sets_shared(self):
+        mod1 = create_mod_instance(games={"BGEE", "BG2"})
+        mod2 = Mod.construct(mod_kwargs | {"games": ["BG2", "BGEE"]})
+
+        assert mod1.games is mod2.games
+        assert mod1.status is mod2.status
+
     def test_mod_is_weidu(self):
         mod = create_mod_instance(tp2="toto")
         expected_value = True
@@ -151,6 +224,57 @@ class TestMod:
 
         assert mod._convert_link(source_value) == expected_value
 
+    def test_mod_convert_txt(self):
+        mod = create_mod_instance(id=1, name="Toto")
+        source_value = "[[1]]|`[Titi](titi.com)`|`a|b`"
+        expected_value = (
+            '<a href="#m1">Toto</a><br/>'
+            '<span class="quote"><a href="titi.com" target="_blank">Titi</a></span><br/>'
+            '<span class="quote">a<br/>b</span>'
+        )
+
+        assert mod.convert_txt(source_value, mod_id_to_name={1: "Toto"}) == expected_value
+
+    def test_mod_convert_txt_external_link_pipe(self):
+        mod = create_mod_instance(id=1, name="Toto")
+        source_value = "[To|to](toto.com)"
+        expected_value = '<a href="toto.com" target="_blank">To<br/>to</a>'
+
+        assert mod.convert_txt(source_value) == expected_value
+
+    def test_mod_get_description_cached(self, render_cache, mocker):
+        mod = create_mod_instance(description="[[2]]")
+        spy = mocker.spy(Mod, "convert_txt")
+
+        assert mod.get_description({2: "Toto"}) == '<a href="#m2">Toto</a>'
+        assert mod.get_description({2: "Toto"}) == '<a href="#m2">Toto</a>'
+        assert spy.call_count == 1
+
+    def test_mod_get_description_linked_name_changed(self, render_cache):
+        mod = create_mod_instance(description="[[2]]")
+
+        assert mod.get_description({2: "Toto"}) == '<a href="#m2">Toto</a>'
+        assert mod.get_description({2: "Titi"}) == '<a href="#m2">Titi</a>'
+
+    def test_mod_get_notes_cached_content(self, render_cache):
+        assert create_mod_instance(notes=["a"]).get_notes() == ["a"]
+        assert create_mod_instance(notes=["b"]).get_notes() == ["b"]
+
+    def test_render_cache_persistence(self, tmp_path):
+        path = tmp_path / "render.json"
+        cache = RenderCache()
+        cache.load(path, version="1")
+        cache.get("key", lambda: ["a"])
+        cache.save()
+
+        cache = RenderCache()
+        cache.load(path, version="1")
+        assert cache.get("key", lambda: ["b"]) == ["a"]
+
+        cache = RenderCache()
+        cache.load(path, version="2")
+        assert cache.get("key", lambda: ["b"]) == ["b"]
+
     def test_mod_get_internal_link(self, mod):
         source_value = 1
         expected_value = '<a href="#m1">Toto</a>'
@@ -0,0 +1,171 @@
+from collections import Counter
+import re
+
+import pytest
+
+from i18n import LANGUAGE_CONFIG, TEMPLATE_TRANSLATIONS
+from scripts.update_index import (
+    BuildManifest,
+    MinifyTemplateExtension,
+    build_html_page,
+    create_page_language,
+    get_environment,
+    get_page_hash,
+    iter_page_chunks,
+    render_mod_row,
+)
+from settings import CategoryEnum, language_flags
+from tests.test_mod import create_mod_instance
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, mocker):
+    # Le cache de bytecode Jinja est créé (et purgé) dans CACHE_PATH
+    mocker.patch("scripts.update_index.CACHE_PATH", tmp_path)
+    get_environment.cache_clear()
+    yield tmp_path
+    get_environment.cache_clear()
+
+
+def build_test_page(dedupe: bool) -> str:
+    mod = create_mod_instance(id=1, name="Toto")
+    categories = {category: list() for category in CategoryEnum}
+    categories[CategoryEnum.FIX] = [mod]
+    categories[CategoryEnum.KIT] = [mod]
+
+    with LANGUAGE_CONFIG.switch_language("fr"):
+        return "".join(
+            build_html_page(
+                language_flags,
+                dedupe,
+                static="static/",
+                categories=categories,
+                mod_length=1,
+                language="fr",
+                mod_id_to_name={1: "Toto"},
+                is_home_page=False,
+            )
+        )
+
+
+class TestUpdateIndex:
+    def test_render_mod_row(self):
+        mod = create_mod_instance(id=1, name="Toto")
+        template = get_environment().get_template("mod.html")
+
+        mod_row = render_mod_row(
+            template,
+            mod,
+            static="static/",
+            trans=TEMPLATE_TRANSLATIONS,
+            mod_id_to_name={1: "Toto"},
+        )
+
+        assert "<summary class=name>Toto</summary>" in mod_row
+
+    def test_render_mod_row_minify_templates(self):
+        mod = create_mod_instance(id=1, name="Toto", authors=["a", "b"], notes=["note"])
+        context = {
+            "static": "static/",
+            "trans": TEMPLATE_TRANSLATIONS,
+            "mod_id_to_name": {1: "Toto"},
+        }
+
+        assert render_mod_row(
+            get_environment(False).get_template("mod.html"), mod, **context
+        ) == render_mod_row(get_environment(True).get_template("mod.html"), mod, **context)
+
+    def test_iter_page_chunks(self, mocker):
+        mods = {1: create_mod_instance(id=1), 2: create_mod_instance(id=2)}
+        html_frame = (
+            "<div data-mod-row=1></div><div data-mod-row=2></div><div data-mod-row=1></div>"
+        )
+        render_row = mocker.Mock(side_effect=lambda mod: f"<p>{mod.id}</p>")
+
+        page = "".join(iter_page_chunks(html_frame, mods, Counter({1: 2, 2: 1}), render_row))
+
+        assert page == "<p>1</p><p>2</p><p>1</p>"
+        assert render_row.call_count == 2
+
+    def test_build_html_page_placeholder_not_found(self, mocker):
+        mocker.patch("scripts.update_index.mod_row_placeholder_regex", re.compile("toto"))
+
+        with pytest.raises(AssertionError):
+            build_test_page(dedupe=False)
+
+    def test_minify_template_extension(self):
+        extension = MinifyTemplateExtension(get_environment())
+        source = "<div>\n    <p>{{ a }}</p>\n    {% if b %}\n        <p>b</p>\n    {% endif %}\n</div>"
+        expected_value = "<div> <p>{{ a }}</p> {% if b %}\n <p>b</p> {% endif %}\n</div>"
+
+        assert extension.preprocess(source, "toto.html") == expected_value
+        assert extension.preprocess(source, "toto.txt") == source
+
+    def test_build_html_page(self):
+        page = build_test_page(dedupe=False)
+
+        assert page.count("<summary class=name>Toto</summary>") == 2
+        assert "<template data-mod=" not in page
+
+    def test_build_html_page_dedupe(self):
+        page = build_test_page(dedupe=True)
+
+        assert page.count("<summary class=name>Toto</summary>") == 1
+        assert page.count("<template data-mod=m1>") == 1
+        # la ligne complète est dans la première catégorie, la référence dans la suivante
+        assert page.index("id=m1") < page.index("<template data-mod=m1>")
+
+    def test_page_hash_options(self):
+        assert get_page_hash("fr", dedupe=False) == get_page_hash("fr", dedupe=False)
+        assert get_page_hash("fr", dedupe=False) != get_page_hash("fr", dedupe=True)
+        assert get_page_hash("fr") != get_page_hash("pl")
+
+    def test_page_hash_renderer_version(self, mocker):
+        page_hash = get_page_hash("fr")
+        mocker.patch("scripts.update_index.version", return_value="0.0.0")
+
+        assert get_page_hash("fr") != page_hash
+
+    def test_build_manifest(self, tmp_path, mocker):
+        page_path = tmp_path / "index.html"
+        mocker.patch("scripts.update_index.get_page_path", return_value=page_path)
+        manifest = BuildManifest()
+        manifest.pages["fr"] = {"hash": "1", "authors": [], "team": []}
+        manifest.save()
+
+        manifest = BuildManifest()
+        assert not manifest.is_fresh("fr", "1")  # page absente
+        page_path.write_text("")
+        assert manifest.is_fresh("fr", "1")
+        assert not manifest.is_fresh("fr", "2")
+
+    def test_create_page_language_unchanged(self, tmp_path, mocker):
+        page_path = tmp_path / "fr" / "index.html"
+        mocker.patch("scripts.update_index.get_page_path", return_value=page_path)
+
+        assert create_page_language(["<p>", "toto</p>"], "fr") is True
+        mtime = page_path.stat().st_mtime_ns
+        assert create_page_language(["<p>", "toto</p>"], "fr") is False
+        assert page_path.stat().st_mtime_ns == mtime
+        assert create_page_language(["<p>", "titi</p>"], "fr") is True
+        assert page_path.read_text(encoding="utf-8") == "<p>titi</p>"
+
+    def test_create_page_language_error(self, tmp_path, mocker):
+        page_path = tmp_path / "fr" / "index.html"
+        mocker.patch("scripts.update_index.get_page_path", return_value=page_path)
+        create_page_language(["<p>toto</p>"], "fr")
+
+        def page_chunks():
+            yield "<p>"
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            create_page_language(page_chunks(), "fr")
+        assert page_path.read_text(encoding="utf-8") == "<p>toto</p>"
+        assert not page_path.with_suffix(".tmp").exists()
+
+    def test_bytecode_cache_path(self, cache_path):
+        get_environment().get_template("mod.html")
+        assert [path.name.split("-")[0] for path in (cache_path / "jinja").iterdir()] == [
+            "minified"
+        ]
@@ -1,4 +1,7 @@
-from models.url import HttpUrl
+from pydantic import TypeAdapter, ValidationError
+import pytest
+
+from models.url import HttpUrl, InternedHttpUrl
 
 
 class TestUrl:
@@ -14,6 +17,41 @@ class TestUrl:
 
         assert HttpUrl(url).url == expected_value
 
+    def test_from_trusted(self):
+        url = "https://toto.com/file.zip"
+        expected_value = HttpUrl(url)
+
+        assert HttpUrl.from_trusted(url) == expected_value
+
+    def test_from_trusted_interned(self):
+        url = "https://toto.com/interned"
+
+        assert HttpUrl.from_trusted(url) is HttpUrl.from_trusted(url)
+
+    def test_from_trusted_validated(self):
+        with pytest.raises(ValidationError):
+            HttpUrl.from_trusted("ftp://toto.com/trusted")
+
+    def test_interned_validation(self):
+        url = "https://toto.com/validated"
+        adapter = TypeAdapter(list[InternedHttpUrl])
+        urls = adapter.validate_python([url, url])
+
+        assert urls[0] is urls[1]
+        assert urls[0] is HttpUrl.from_trusted(url)
+
+    def test_interned_validation_error(self):
+        with pytest.raises(ValidationError):
+            TypeAdapter(InternedHttpUrl).validate_python("toto")
+
+    def test_interned_validation_error_after_from_trusted(self):
+        url = "ftp://toto.com/interned"
+        with pytest.raises(ValidationError):
+            HttpUrl.from_trusted(url)
+
+        with pytest.raises(ValidationError):
+            TypeAdapter(InternedHttpUrl).validate_python(url)
+
     def test_is_direct_archive(self):
         url = "https://toto.com/"
         expected_value = False
@@ -85,4 +123,17 @@ class TestUrl:
 
         assert HttpUrl(url)._image_domain() == expected_value
 
+    def test_image_country(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        url = "https://toto.fr/"
+        expected_value = "fr-flag-32.png"
+
+        assert HttpUrl(url)._image_country() == expected_value
+
+    def test_image_country_not_found(self):
+        url = "https://toto.com/"
+        expected_value = ""
+
+        assert HttpUrl(url)._image_country() == expected_value
+
     # TODO url.image
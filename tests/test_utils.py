@@ -0,0 +1,309 @@
+import json
+import os
+import tracemalloc
+
+from pydantic import ValidationError
+import pytest
+
+from models.mod import Mod
+from scripts.utils import LayeredMod, ModLayer, ModManager, PhaseProfiler
+from tests.test_mod import mod_kwargs
+
+
+@pytest.fixture
+def profiler():
+    profiler = PhaseProfiler()
+    yield profiler
+    tracemalloc.stop()
+
+
+def write_db(db_path, mods, language=""):
+    filename = ModManager.get_language_filename(language=language)
+    with open(db_path / filename, "w", encoding="utf-8") as f:
+        json.dump(mods, f)
+
+
+class TestModManager:
+    def test_load(self, db_path):
+        mods = [{"id": 1, "urls": ["https://toto.com"]}]
+        write_db(db_path, mods)
+
+        assert ModManager.load("") == mods
+
+    def test_load_parsed_once(self, db_path, mocker):
+        write_db(db_path, [{"id": 1}])
+        json_load = mocker.spy(json, "load")
+
+        ModManager.load("")
+        ModManager.load("")
+
+        assert json_load.call_count == 1
+
+    def test_load_return_copy(self, db_path):
+        write_db(db_path, [{"id": 1, "urls": ["https://toto.com"]}])
+
+        mods = ModManager.load("")
+        mods[0]["urls"].append("https://titi.com")
+        expected_value = [{"id": 1, "urls": ["https://toto.com"]}]
+
+        assert ModManager.load("") == expected_value
+
+    def test_export_refresh_snapshot(self, db_path):
+        write_db(db_path, [{"id": 1}])
+        ModManager.load("")
+        expected_value = [{"id": 1}, {"id": 2}]
+
+        ModManager.export(expected_value, language="")
+
+        assert ModManager.load("") == expected_value
+
+    def test_get_combine_language_keep_source(self, db_path):
+        source_list = [{"id": 1, "urls": ["https://toto.com"], "notes": []}]
+        write_db(db_path, [{"id": 1, "urls_extra": ["https://titi.com"]}], language="en")
+
+        combined = ModManager.get_combine_language(source_list, "en", merge_urls_extra=True)
+
+        assert combined[0]["urls"] == ["https://toto.com", "https://titi.com"]
+        assert source_list[0]["urls"] == ["https://toto.com"]
+
+    def test_compile(self, db_path):
+        mods = [
+            {
+                "id": 1,
+                "name": "mod name",
+                "categories": [],
+                "urls": [],
+                "description": "description",
+                "team": [],
+                "languages": [],
+                "games": [],
+                "notes": [],
+                "compatibilities": {},
+                "safe": 2,
+                "translation_state": "auto",
+                "status": [],
+                "authors": [],
+                "last_update": "",
+                "tp2": "",
+            }
+        ]
+        write_db(db_path, mods)
+        write_db(db_path, [{"id": 1, "description": "translated"}], language="en")
+        (db_path / "author_pseudos.json").write_text("{}")
+
+        ModManager.compile()
+
+        assert ModManager.get_compiled() is not None
+        assert ModManager.get_source_list("en")[0]["description"] == "translated"
+
+    def test_compile_outdated(self, db_path):
+        write_db(db_path, [])
+        (db_path / "author_pseudos.json").write_text("{}")
+        ModManager.compile()
+
+        write_db(db_path, [{"id": 1}])
+        compiled_mtime = (db_path / ModManager.compiled_filename).stat().st_mtime
+        os.utime(db_path / "mods.json", (compiled_mtime + 1, compiled_mtime + 1))
+
+        assert ModManager.get_compiled() is None
+
+    def test_compile_code_changed(self, db_path, mocker):
+        write_db(db_path, [])
+        (db_path / "author_pseudos.json").write_text("{}")
+        ModManager.compile()
+
+        mocker.patch.object(ModManager, "get_compiled_code_hash", return_value="other")
+
+        assert ModManager.get_compiled() is None
+
+    def test_get_mod_list_compiled(self, db_path, mocker):
+        write_db(db_path, [mod_kwargs | {"games": [], "status": []}])
+        (db_path / "author_pseudos.json").write_text("{}")
+        ModManager.compile()
+        validate_many = mocker.spy(Mod, "validate_many")
+
+        mods = ModManager.get_mod_list("")
+
+        assert mods[0].name == mod_kwargs["name"]
+        assert validate_many.call_count == 0
+
+    def test_validation_stamp(self, db_path):
+        write_db(db_path, [mod_kwargs | {"games": [], "status": []}])
+        (db_path / "author_pseudos.json").write_text("{}")
+
+        ModManager.write_validation_stamp([""])
+
+        assert ModManager.is_validated("") is True
+        assert ModManager.is_validated("en") is False
+
+    def test_validation_stamp_outdated(self, db_path):
+        write_db(db_path, [])
+        (db_path / "author_pseudos.json").write_text("{}")
+        ModManager.write_validation_stamp([""])
+
+        write_db(db_path, [{"id": 1}])
+
+        assert ModManager.is_validated("") is False
+
+    def test_get_mod_list_trusted(self, db_path, mocker):
+        write_db(db_path, [mod_kwargs | {"games": [], "status": []}])
+        (db_path / "author_pseudos.json").write_text("{}")
+        ModManager.write_validation_stamp([""])
+        validate_many = mocker.spy(Mod, "validate_many")
+
+        mods = ModManager.get_mod_list("", trusted=True)
+
+        assert mods[0].name == mod_kwargs["name"]
+        assert validate_many.call_count == 0
+
+    def test_get_mod_list_validation_cache(self, db_path, mocker):
+        write_db(db_path, [mod_kwargs | {"games": [], "status": []}])
+        ModManager.get_mod_list("")
+        validate_many = mocker.spy(Mod, "validate_many")
+
+        mods = ModManager.get_mod_list("")
+
+        assert mods[0].name == mod_kwargs["name"]
+        assert validate_many.spy_return == []
+
+    def test_get_mod_list_validation_cache_changed_record(self, db_path):
+        write_db(db_path, [mod_kwargs | {"games": [], "status": []}])
+        ModManager.get_mod_list("")
+
+        write_db(db_path, [mod_kwargs | {"games": [], "status": [], "last_update": "25-12"}])
+
+        with pytest.raises(ValidationError):
+            ModManager.get_mod_list("")
+
+    def test_get_mod_list_validation_cache_error_location(self, db_path):
+        records = [mod_kwargs | {"id": mod_id, "games": [], "status": []} for mod_id in (1, 2)]
+        write_db(db_path, records)
+        ModManager.get_mod_list("")
+
+        records[1]["last_update"] = "25-12"
+        write_db(db_path, records)
+
+        with pytest.raises(ValidationError) as exc_info:
+            ModManager.get_mod_list("")
+        assert exc_info.value.errors()[0]["loc"] == ("id=2", "last_update")
+
+    def test_load_interned(self, db_path):
+        write_db(db_path, [{"id": 1, "authors": ["toto"]}])
+        write_db(db_path, [{"id": 1, "notes": ["toto"]}], language="en")
+
+        author = ModManager.get_snapshot(language="")[0]["authors"][0]
+        note = ModManager.get_snapshot(language="en")[0]["notes"][0]
+        assert author is note
+
+    def test_load_author_pseudos(self, db_path, mocker):
+        mocker.patch.dict("scripts.utils.AUTHOR_PSEUDOS", {"toto": "Toto"})
+        write_db(db_path, [{"id": 1, "authors": ["toto", "Titi", "Toto"]}])
+
+        assert ModManager.get_snapshot(language="")[0]["authors"] == ["Toto", "Titi"]
+
+
+class TestLayeredMod:
+    def test_resolve_base(self):
+        mod = LayeredMod({"id": 1, "name": "Toto"})
+
+        assert mod["name"] == "Toto"
+
+    def test_resolve_overlay(self):
+        mod = LayeredMod({"id": 1, "name": "Toto"}).overlay(
+            ModLayer(data={"name": "Titi"}, exclude_fields=frozenset(), merge_fields=dict())
+        )
+
+        assert mod["name"] == "Titi"
+
+    def test_resolve_overlay_empty_value(self):
+        mod = LayeredMod({"id": 1, "name": "Toto"}).overlay(
+            ModLayer(data={"name": ""}, exclude_fields=frozenset(), merge_fields=dict())
+        )
+
+        assert mod["name"] == "Toto"
+
+    def test_resolve_excluded_field(self):
+        mod = LayeredMod({"id": 1, "team": []}).overlay(
+            ModLayer(data={"team": ["Titi"]}, exclude_fields={"team"}, merge_fields=dict())
+        )
+
+        assert mod["team"] == []
+        assert dict(mod) == {"id": 1, "team": []}
+
+    def test_resolve_merge_fields(self):
+        base = {"id": 1, "urls": ["https://toto.com"]}
+        mod = (
+            LayeredMod(base)
+            .overlay(
+                ModLayer(
+                    data={"urls_extra": ["https://en.com"]},
+                    exclude_fields=frozenset(),
+                    merge_fields=dict(),
+                )
+            )
+            .overlay(
+                ModLayer(
+                    data={}, exclude_fields=frozenset(), merge_fields={"urls": "urls_extra"}
+                )
+            )
+        )
+        expected_value = ["https://toto.com", "https://en.com"]
+
+        assert mod["urls"] == expected_value
+        assert base["urls"] == ["https://toto.com"]
+
+    def test_validate_many(self):
+        mod = LayeredMod(mod_kwargs).overlay(
+            ModLayer(data={"name": "Titi"}, exclude_fields=frozenset(), merge_fields=dict())
+        )
+
+        assert Mod.validate_many([mod])[0].name == "Titi"
+
+
+class TestPhaseProfiler:
+    def test_disabled(self, profiler):
+        with profiler.page("fr"), profiler.phase("render"):
+            pass
+
+        assert profiler.pages == dict()
+
+    def test_phases(self, profiler):
+        profiler.enable()
+        with profiler.page("fr"):
+            for _ in range(2):
+                with profiler.phase("render"), profiler.phase("minify"):
+                    data = [0] * 100_000
+                    del data
+
+        assert list(profiler.pages) == ["fr"]
+        assert profiler.pages["fr"]["render"]["calls"] == 2
+        # marge large : d'autres allocations (ex : libérations) se mêlent à la mesure
+        assert profiler.pages["fr"]["minify"]["peak_memory"] >= 400_000
+        # le pic d'une étape inclut celui de ses sous-étapes
+        assert (
+            profiler.pages["fr"]["render"]["peak_memory"]
+            >= profiler.pages["fr"]["minify"]["peak_memory"]
+        )
+        assert profiler.current_page == "main"
+
+    def test_self_duration(self, profiler, mocker):
+        mocker.patch("scripts.utils.perf_counter", side_effect=[0.0, 1.0, 3.0, 4.0])
+        profiler.enable()
+        with profiler.phase("write"), profiler.phase("render"):
+            pass
+
+        stats = profiler.pages["main"]
+        assert (stats["write"]["duration"], stats["write"]["self_duration"]) == (4.0, 2.0)
+        assert (stats["render"]["duration"], stats["render"]["self_duration"]) == (2.0, 2.0)
+
+    def test_save(self, profiler, tmp_path, mocker):
+        mocker.patch("scripts.utils.CACHE_PATH", tmp_path)
+        profiler.enable()
+        with profiler.phase("sort"):
+            pass
+
+        with open(profiler.save(jobs=1), "r", encoding="utf-8") as f:
+            report = json.load(f)
+
+        assert report["jobs"] == 1
+        assert report["pages"]["main"]["sort"]["calls"] == 1